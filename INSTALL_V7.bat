@@ -22,7 +22,7 @@ echo.
 python -m pip install --upgrade pip
 python -m pip uninstall -y web3
 python -m pip install web3==7.6.0
-python -m pip install customtkinter requests python-dotenv pyyaml eth-account
+python -m pip install customtkinter requests python-dotenv pyyaml eth-account "eth-hash[pycryptodome]"
 
 if %ERRORLEVEL% NEQ 0 (
     echo ❌ Dependency installation failed!
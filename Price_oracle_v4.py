@@ -4,186 +4,541 @@ Priority: Bullscope > GoPulse > DexScreener > Moralis > GeckoTerminal > Fallback
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict
 import time
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from decimal import Decimal, localcontext
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from types import MappingProxyType
+
+# orjson parses API payloads much faster; stdlib json is the fallback
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    from json import loads as _loads
+
+# httpx + h2 give HTTP/2 multiplexing (one connection per API host); requests is the fallback
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for http2=True
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# 1 token = 10**18 wei (exact, used for Decimal math)
+WEI = Decimal(10) ** 18
+
+logger = logging.getLogger(__name__)
+
+# Token address mapping for PulseChain (keys are uppercase symbols)
+_TOKEN_MAP = MappingProxyType({
+    'PLS': '0xA1077a294dDE1B09bB078844df40758a5D0f9a27',  # Use WPLS for price
+    'WPLS': '0xA1077a294dDE1B09bB078844df40758a5D0f9a27',
+    'HEX': '0x2b591e99afE9f32eAA6214f7B7629768c40Eeb39',
+    'PLSX': '0x95B303987A60C71504D99Aa1b13B4DA07b0790ab',
+    'INC': '0x2fa878Ab3F87CC1C9737Fc071108F904c0B0C95d',
+    'TEDDY': '0x4fE5851C9af07df9E5AD8217afAE1ea72737EbdA',
+    'USDC': '0x15D38573d2feeb82e7ad5187aB8c1D52810B1f07',
+    'DAI': '0xefD766cCb38EaF1dfd701853BFCe31359239F305',
+    'WBTC': '0xb17D901469B9208B17d916112988A3FeD19b5cA1',
+    'WETH': '0x02DcdD04e3F455D838cd1249292C58f3B79e3C3C',
+})
+
+# Reverse lookup: lowercase address -> symbol (first symbol wins, e.g. PLS over WPLS)
+_addr_to_symbol = {}
+for _symbol, _token_addr in _TOKEN_MAP.items():
+    _addr_to_symbol.setdefault(_token_addr.lower(), _symbol)
+_ADDR_TO_SYMBOL = MappingProxyType(_addr_to_symbol)
+
+# Approximate prices used when every source fails
+_FALLBACK_PRICES = MappingProxyType({
+    'PLS': 0.00001,
+    'WPLS': 0.00001,
+    'HEX': 0.005,
+    'PLSX': 0.000001,
+    'INC': 0.00001,
+    'TEDDY': 0.00000001,
+    'USDC': 1.0,
+    'DAI': 1.0,
+    'WBTC': 95000.0,
+    'WETH': 3500.0,
+})
+
+# Transient statuses retried on both HTTP paths (same policy as the requests Retry)
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+if HTTPX_AVAILABLE:
+    class _RetryTransport(httpx.HTTPTransport):
+        """HTTPTransport that also retries GETs on transient status codes (retries= only covers connect errors)"""
+        
+        def __init__(self, status_retries: int = 2, backoff_factor: float = 0.2, **kwargs):
+            super().__init__(**kwargs)
+            self.status_retries = status_retries
+            self.backoff_factor = backoff_factor
+        
+        def handle_request(self, request):
+            response = super().handle_request(request)
+            for attempt in range(self.status_retries):
+                if request.method != 'GET' or response.status_code not in _RETRY_STATUSES:
+                    break
+                response.close()
+                time.sleep(self.backoff_factor * (2 ** attempt))
+                response = super().handle_request(request)
+            return response
 
 class PriceOracle:
     """Fetch real-time token prices from multiple sources"""
     
+    # API endpoint templates (formatted with the token address)
+    _BULLSCOPE_URL = "https://api.bullscope.com/pulsechain/tokens/{}"
+    _GOPULSE_URL = "https://api.gopulse.com/api/v1/tokens/{}/price"
+    _DEXSCREENER_URL = "https://api.dexscreener.com/latest/dex/tokens/{}"
+    _GECKO_URL = "https://api.geckoterminal.com/api/v2/networks/pulsechain/tokens/{}"
+    
+    # Network errors, bad JSON and unexpected payload shapes (AttributeError: .get on a list/null body)
+    # - anything else is a real bug
+    _FETCH_ERRORS = (requests.RequestException, ValueError, KeyError, TypeError, AttributeError) + (
+        (httpx.HTTPError,) if HTTPX_AVAILABLE else ()
+    )
+    
     def __init__(self):
-        self.cache = {}
-        self.cache_duration = 30  # 30 seconds
-        
-        # Token address mapping for PulseChain
-        self.token_map = {
-            'PLS': '0xA1077a294dDE1B09bB078844df40758a5D0f9a27',  # Use WPLS for price
-            'WPLS': '0xA1077a294dDE1B09bB078844df40758a5D0f9a27',
-            'HEX': '0x2b591e99afE9f32eAA6214f7B7629768c40Eeb39',
-            'PLSX': '0x95B303987A60C71504D99Aa1b13B4DA07b0790ab',
-            'INC': '0x2fa878Ab3F87CC1C9737Fc071108F904c0B0C95d',
-            'TEDDY': '0x4fE5851C9af07df9E5AD8217afAE1ea72737EbdA',
-            'USDC': '0x15D38573d2feeb82e7ad5187aB8c1D52810B1f07',
-            'DAI': '0xefD766cCb38EaF1dfd701853BFCe31359239F305',
-            'WBTC': '0xb17D901469B9208B17d916112988A3FeD19b5cA1',
-            'WETH': '0x02DcdD04e3F455D838cd1249292C58f3B79e3C3C',
+        # Bounded LRU cache: symbol -> (fetched_at, price)
+        self.cache = OrderedDict()
+        self.cache_maxsize = 4096
+        self.cache_lock = threading.Lock()
+        self.last_cache_sweep = time.time()
+        self.cache_duration = 30  # Default TTL: 30 seconds
+        
+        # Per-symbol TTL (stablecoins barely move, majors move slower than small caps)
+        self.ttl_map = {
+            'USDC': 3600,
+            'DAI': 3600,
+            'WBTC': 120,
+            'WETH': 120,
         }
         
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        # Stale-while-revalidate: symbols with a background refresh in flight
+        self.refreshing = set()
+        self.refresh_lock = threading.Lock()
+        
+        # Single-flight: symbol -> Event set when the leading fetch finishes
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self.dexscreener_batch_size = 30  # Max addresses per DexScreener request
+        
+        # Negative cache: (source, address) -> time of last failed lookup
+        self.neg_cache = {}
+        self.neg_ttl = 60  # Skip a failed source for 60 seconds
+        
+        # Token address mapping for PulseChain (shared, read-only)
+        self.token_map = _TOKEN_MAP
+        self.address_to_symbol = _ADDR_TO_SYMBOL
+        
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip'
+        }
+        
+        if HTTPX_AVAILABLE:
+            # HTTP/2 client (same get/raise_for_status/content API as a requests session)
+            # with the same retry policy as the requests path: 2 connect + 2 status retries
+            transport = _RetryTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+            )
+            self.session = httpx.Client(
+                transport=transport,
+                headers=headers,
+                timeout=5.0,
+                follow_redirects=True
+            )
+        else:
+            self.session = requests.Session()
+            self.session.headers.update(headers)
+            
+            # Bigger keep-alive pool (many threads share this session) + retry on transient errors
+            retry = Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=_RETRY_STATUSES,
+                allowed_methods=frozenset(['GET'])
+            )
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+        
+        # Worker pool so all price sources are queried at the same time
+        self.executor = ThreadPoolExecutor(max_workers=5)
+        
+        # Separate pool for background refreshes (they wait on self.executor)
+        self.refresh_executor = ThreadPoolExecutor(max_workers=2)
     
     def get_address(self, token_symbol: str) -> str:
         """Get token address from symbol"""
-        return self.token_map.get(token_symbol.upper(), '')
+        # Internal callers already pass uppercase symbols - skip the .upper() copy then
+        symbol = token_symbol if token_symbol.isupper() else token_symbol.upper()
+        return self.token_map.get(symbol, '')
     
-    def get_price(self, token_symbol: str) -> float:
-        """Get token price with caching and fallback sources"""
+    def get_ttl(self, token_symbol: str) -> float:
+        """Get cache TTL (seconds) for a symbol"""
+        return self.ttl_map.get(token_symbol, self.cache_duration)
+    
+    def get_price(self, token_symbol: str, budget: Optional[float] = None) -> float:
+        """
+        Get token price with caching and fallback sources
+        budget: max seconds to spend on upstream sources before using the fallback price
+        """
         token_upper = token_symbol.upper()
         
         # Check cache
-        if token_upper in self.cache:
-            cached_time, cached_price = self.cache[token_upper]
-            if time.time() - cached_time < self.cache_duration:
+        entry = self._cache_get(token_upper)
+        if entry:
+            cached_time, cached_price = entry
+            age = time.time() - cached_time
+            ttl = self.get_ttl(token_upper)
+            
+            if age < ttl:
+                return cached_price
+            
+            # Stale but still usable: serve it and refresh in the background
+            if age < 2 * ttl:
+                self._schedule_refresh(token_upper)
                 return cached_price
         
+        deadline = time.monotonic() + budget if budget is not None else None
+        return self._refresh_price(token_upper, deadline)
+    
+    def _request_timeout(self, deadline: Optional[float]) -> Optional[float]:
+        """HTTP timeout for one request: 5s, or what is left of the deadline (None = out of time)"""
+        if deadline is None:
+            return 5
+        remaining = deadline - time.monotonic()
+        return remaining if remaining > 0.05 else None
+    
+    def _cache_get(self, key: str) -> Optional[tuple]:
+        """Read a cache entry and mark it as recently used"""
+        with self.cache_lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.cache.move_to_end(key)
+            return entry
+    
+    def _cache_put(self, key: str, price: float, fetched_at: float = None):
+        """Store a price, evicting least recently used entries above cache_maxsize"""
+        now = time.time()
+        with self.cache_lock:
+            self.cache[key] = (fetched_at or now, price)
+            self.cache.move_to_end(key)
+            
+            while len(self.cache) > self.cache_maxsize:
+                self.cache.popitem(last=False)
+            
+            # Every 60s also drop entries too old to be served even as stale
+            if now - self.last_cache_sweep > 60:
+                self.last_cache_sweep = now
+                expired = [
+                    k for k, (cached_time, _) in self.cache.items()
+                    if now - cached_time >= 2 * self.get_ttl(k)
+                ]
+                for k in expired:
+                    del self.cache[k]
+    
+    def _schedule_refresh(self, token_upper: str):
+        """Start a background refresh for a symbol unless one is already running"""
+        with self.refresh_lock:
+            if token_upper in self.refreshing:
+                return
+            self.refreshing.add(token_upper)
+        
+        self.refresh_executor.submit(self._background_refresh, token_upper)
+    
+    def _background_refresh(self, token_upper: str):
+        """Refresh a cached price, then clear the in-flight marker"""
+        try:
+            self._refresh_price(token_upper)
+        finally:
+            with self.refresh_lock:
+                self.refreshing.discard(token_upper)
+    
+    def _refresh_price(self, token_upper: str, deadline: Optional[float] = None) -> float:
+        """Fetch a fresh price, sharing one upstream fetch between concurrent callers"""
+        with self._inflight_lock:
+            event = self._inflight.get(token_upper)
+            leader = event is None
+            if leader:
+                event = threading.Event()
+                self._inflight[token_upper] = event
+        
+        # Another thread is already fetching this symbol: wait and reuse its result
+        if not leader:
+            event.wait(timeout=10 if deadline is None else max(0, deadline - time.monotonic()))
+            entry = self._cache_get(token_upper)
+            if entry:
+                return entry[1]
+            return self._fetch_and_cache_price(token_upper, deadline)
+        
+        try:
+            return self._fetch_and_cache_price(token_upper, deadline)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[token_upper]
+            event.set()
+    
+    def _fetch_and_cache_price(self, token_upper: str, deadline: Optional[float] = None) -> float:
+        """Fetch a fresh price from the sources and store it in the cache"""
         # Get address
         address = self.get_address(token_upper)
         if not address:
             return self._get_fallback_price(token_upper)
         
-        # Try sources in priority order
-        price = None
-        
-        # 1. Bullscope
-        price = self._fetch_bullscope(address, token_upper)
+        # Query all sources concurrently, keep the priority order
+        price = self._fetch_first_price(address, token_upper, deadline)
         if price and price > 0:
-            self.cache[token_upper] = (time.time(), price)
+            self._cache_put(token_upper, price)
             return price
         
-        # 2. GoPulse
-        price = self._fetch_gopulse(address, token_upper)
-        if price and price > 0:
-            self.cache[token_upper] = (time.time(), price)
-            return price
-        
-        # 3. DexScreener
-        price = self._fetch_dexscreener(address)
-        if price and price > 0:
-            self.cache[token_upper] = (time.time(), price)
-            return price
+        # Fallback (not cached if we only gave up because the budget ran out)
+        fallback = self._get_fallback_price(token_upper)
+        if deadline is None or time.monotonic() < deadline:
+            self._cache_put(token_upper, fallback)
+        return fallback
+    
+    def _fetch_first_price(self, address: str, symbol: str, deadline: Optional[float] = None) -> Optional[float]:
+        """
+        Fire every source at once and return the first positive price in priority order
+        Priority: Bullscope > GoPulse > DexScreener > GeckoTerminal > Moralis
+        """
+        sources = [
+            ('bullscope', self._fetch_bullscope, (address, symbol, deadline)),
+            ('gopulse', self._fetch_gopulse, (address, symbol, deadline)),
+            ('dexscreener', self._fetch_dexscreener, (address, deadline)),
+            ('geckoterminal', self._fetch_geckoterminal, (address, deadline)),
+            ('moralis', self._fetch_moralis, (address, deadline)),
+        ]
         
-        # 4. GeckoTerminal
-        price = self._fetch_geckoterminal(address)
-        if price and price > 0:
-            self.cache[token_upper] = (time.time(), price)
-            return price
+        # Skip sources that failed for this address recently
+        now = time.time()
+        futures = [
+            (name, self.executor.submit(fetch, *args))
+            for name, fetch, args in sources
+            if now - self.neg_cache.get((name, address), 0) >= self.neg_ttl
+        ]
         
-        # 5. Moralis (requires API key)
-        price = self._fetch_moralis(address)
-        if price and price > 0:
-            self.cache[token_upper] = (time.time(), price)
-            return price
+        # Only block on the highest-priority source that is still pending,
+        # lower-priority results are already in flight (or done) meanwhile
+        for name, future in futures:
+            try:
+                price = future.result(
+                    timeout=None if deadline is None else max(0, deadline - time.monotonic())
+                )
+            except FuturesTimeout:
+                # Out of budget - give up without blaming the remaining sources
+                for _, pending in futures:
+                    pending.cancel()
+                return None
+            except Exception:
+                price = None
+            
+            if price and price > 0:
+                for _, pending in futures:
+                    pending.cancel()
+                return price
+            
+            # A source cut short by the deadline did not fail - don't blame it
+            if self._request_timeout(deadline) is None:
+                for _, pending in futures:
+                    pending.cancel()
+                return None
+            
+            self.neg_cache[(name, address)] = time.time()
         
-        # 6. Fallback
-        fallback = self._get_fallback_price(token_upper)
-        self.cache[token_upper] = (time.time(), fallback)
-        return fallback
+        return None
     
-    def _fetch_bullscope(self, address: str, symbol: str) -> Optional[float]:
+    def _fetch_bullscope(self, address: str, symbol: str, deadline: Optional[float] = None) -> Optional[float]:
         """Fetch from Bullscope"""
         try:
             # Bullscope endpoint - using token address
-            url = f"https://api.bullscope.com/pulsechain/tokens/{address}"
-            response = self.session.get(url, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if 'priceUSD' in data:
-                    return float(data['priceUSD'])
-                elif 'price' in data:
-                    return float(data['price'])
-        except:
+            timeout = self._request_timeout(deadline)
+            if timeout is None:
+                return None
+            
+            url = self._BULLSCOPE_URL.format(address)
+            response = self.session.get(url, timeout=timeout)
+            response.raise_for_status()
+            
+            data = _loads(response.content)
+            if 'priceUSD' in data:
+                return float(data['priceUSD'])
+            elif 'price' in data:
+                return float(data['price'])
+        except self._FETCH_ERRORS:
             pass
         return None
     
-    def _fetch_gopulse(self, address: str, symbol: str) -> Optional[float]:
+    def _fetch_gopulse(self, address: str, symbol: str, deadline: Optional[float] = None) -> Optional[float]:
         """Fetch from GoPulse"""
         try:
-            url = f"https://api.gopulse.com/api/v1/tokens/{address}/price"
-            response = self.session.get(url, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if 'usd' in data:
-                    return float(data['usd'])
-                elif 'price' in data:
-                    return float(data['price'])
-        except:
+            timeout = self._request_timeout(deadline)
+            if timeout is None:
+                return None
+            
+            url = self._GOPULSE_URL.format(address)
+            response = self.session.get(url, timeout=timeout)
+            response.raise_for_status()
+            
+            data = _loads(response.content)
+            if 'usd' in data:
+                return float(data['usd'])
+            elif 'price' in data:
+                return float(data['price'])
+        except self._FETCH_ERRORS:
             pass
         return None
     
-    def _fetch_dexscreener(self, address: str) -> Optional[float]:
+    def _fetch_dexscreener(self, address: str, deadline: Optional[float] = None) -> Optional[float]:
         """Fetch from DexScreener"""
         try:
-            url = f"https://api.dexscreener.com/latest/dex/tokens/{address}"
-            response = self.session.get(url, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if 'pairs' in data and len(data['pairs']) > 0:
-                    # Find PulseChain pair with best liquidity
-                    pulsechain_pairs = [p for p in data['pairs'] if p.get('chainId') == 'pulsechain']
-                    if pulsechain_pairs:
-                        # Sort by liquidity
-                        pulsechain_pairs.sort(key=lambda x: x.get('liquidity', {}).get('usd', 0), reverse=True)
-                        best_pair = pulsechain_pairs[0]
-                        if 'priceUsd' in best_pair:
-                            return float(best_pair['priceUsd'])
-        except:
+            timeout = self._request_timeout(deadline)
+            if timeout is None:
+                return None
+            
+            url = self._DEXSCREENER_URL.format(address)
+            response = self.session.get(url, timeout=timeout)
+            response.raise_for_status()
+            
+            data = _loads(response.content)
+            if data.get('pairs'):
+                # Find PulseChain pair with best liquidity
+                pulsechain_pairs = [p for p in data['pairs'] if p.get('chainId') == 'pulsechain']
+                if pulsechain_pairs:
+                    # Sort by liquidity
+                    pulsechain_pairs.sort(key=lambda x: x.get('liquidity', {}).get('usd', 0), reverse=True)
+                    best_pair = pulsechain_pairs[0]
+                    if 'priceUsd' in best_pair:
+                        return float(best_pair['priceUsd'])
+        except self._FETCH_ERRORS:
             pass
         return None
     
-    def _fetch_geckoterminal(self, address: str) -> Optional[float]:
+    def _fetch_dexscreener_batch(self, addresses: list) -> Dict[str, float]:
+        """Fetch many tokens from DexScreener at once (returns lowercase address -> price)"""
+        prices = {}
+        
+        for i in range(0, len(addresses), self.dexscreener_batch_size):
+            chunk = addresses[i:i + self.dexscreener_batch_size]
+            try:
+                url = self._DEXSCREENER_URL.format(','.join(chunk))
+                response = self.session.get(url, timeout=5)
+                response.raise_for_status()
+                
+                data = _loads(response.content)
+                
+                # Keep the PulseChain pair with best liquidity for each token
+                best_pairs = {}
+                for pair in data.get('pairs') or []:
+                    if pair.get('chainId') != 'pulsechain' or 'priceUsd' not in pair:
+                        continue
+                    
+                    token = pair.get('baseToken', {}).get('address', '').lower()
+                    liquidity = pair.get('liquidity', {}).get('usd', 0)
+                    if token not in best_pairs or liquidity > best_pairs[token][0]:
+                        best_pairs[token] = (liquidity, pair['priceUsd'])
+                
+                for token, (liquidity, price_usd) in best_pairs.items():
+                    prices[token] = float(price_usd)
+            except self._FETCH_ERRORS:
+                pass
+        
+        return prices
+    
+    def _fetch_geckoterminal(self, address: str, deadline: Optional[float] = None) -> Optional[float]:
         """Fetch from GeckoTerminal"""
         try:
-            url = f"https://api.geckoterminal.com/api/v2/networks/pulsechain/tokens/{address}"
-            response = self.session.get(url, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if 'data' in data and 'attributes' in data['data']:
-                    attrs = data['data']['attributes']
-                    if 'price_usd' in attrs:
-                        return float(attrs['price_usd'])
-        except:
+            timeout = self._request_timeout(deadline)
+            if timeout is None:
+                return None
+            
+            url = self._GECKO_URL.format(address)
+            response = self.session.get(url, timeout=timeout)
+            response.raise_for_status()
+            
+            data = _loads(response.content)
+            if 'data' in data and 'attributes' in data['data']:
+                attrs = data['data']['attributes']
+                if 'price_usd' in attrs:
+                    return float(attrs['price_usd'])
+        except self._FETCH_ERRORS:
             pass
         return None
     
-    def _fetch_moralis(self, address: str) -> Optional[float]:
+    def _fetch_moralis(self, address: str, deadline: Optional[float] = None) -> Optional[float]:
         """Fetch from Moralis (requires API key)"""
         # Placeholder - implement if you have Moralis API key
         return None
     
     def _get_fallback_price(self, symbol: str) -> float:
         """Fallback approximate prices"""
-        fallbacks = {
-            'PLS': 0.00001,
-            'WPLS': 0.00001,
-            'HEX': 0.005,
-            'PLSX': 0.000001,
-            'INC': 0.00001,
-            'TEDDY': 0.00000001,
-            'USDC': 1.0,
-            'DAI': 1.0,
-            'WBTC': 95000.0,
-            'WETH': 3500.0,
-        }
-        return fallbacks.get(symbol, 0.0)
+        return _FALLBACK_PRICES.get(symbol, 0.0)
     
     def get_multiple_prices(self, symbols: list) -> Dict[str, float]:
-        """Get prices for multiple tokens"""
-        return {symbol: self.get_price(symbol) for symbol in symbols}
+        """Get prices for multiple tokens (one DexScreener request per batch of tokens)"""
+        prices = {}
+        to_fetch = {}
+        
+        # Serve what we can from cache, resolve the rest to addresses
+        now = time.time()
+        for symbol in symbols:
+            token_upper = symbol.upper()
+            entry = self._cache_get(token_upper)
+            if entry:
+                cached_time, cached_price = entry
+                if now - cached_time < self.get_ttl(token_upper):
+                    prices[token_upper] = cached_price
+                    continue
+            
+            address = self.get_address(token_upper)
+            if address:
+                to_fetch[token_upper] = address
+        
+        # One batched lookup for every cache miss
+        if to_fetch:
+            batch_prices = self._fetch_dexscreener_batch(list(set(to_fetch.values())))
+            
+            now = time.time()
+            for token_upper, address in to_fetch.items():
+                price = batch_prices.get(address.lower())
+                if price and price > 0:
+                    self._cache_put(token_upper, price, now)
+                    prices[token_upper] = price
+        
+        # Anything still missing goes through the normal source pipeline
+        return {
+            symbol: prices[symbol.upper()] if symbol.upper() in prices else self.get_price(symbol)
+            for symbol in symbols
+        }
+    
+    async def aget_price(self, token_symbol: str) -> float:
+        """Async version of get_price (runs the blocking lookup off the event loop)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_price, token_symbol)
+    
+    async def aget_multiple_prices(self, symbols: list, concurrency: int = 8) -> Dict[str, float]:
+        """Get prices for multiple tokens concurrently (at most `concurrency` lookups at once)"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch_one(symbol):
+            async with semaphore:
+                return symbol, await self.aget_price(symbol)
+        
+        results = await asyncio.gather(*(fetch_one(symbol) for symbol in symbols))
+        return dict(results)
     
     def calculate_token_amount_for_usd(self, token_symbol: str, usd_value: float) -> int:
         """
@@ -192,16 +547,18 @@ class PriceOracle:
         """
         price = self.get_price(token_symbol)
         if price == 0:
-            print(f"WARNING: Price for {token_symbol} is 0!")
+            logger.warning("Price for %s is 0!", token_symbol)
             return 0
         
-        # Calculate tokens needed
-        token_amount = usd_value / price
+        # Convert to wei (18 decimals) in Decimal so tiny prices keep full precision
+        with localcontext() as ctx:
+            ctx.prec = 40
+            amount_wei = int(Decimal(str(usd_value)) / Decimal(str(price)) * WEI)
         
-        # Convert to wei (18 decimals)
-        amount_wei = int(token_amount * 10**18)
-        
-        print(f"💵 USD→Token: ${usd_value} / ${price} = {token_amount:.2f} {token_symbol} = {amount_wei} wei")
+        # Guarded: the token amount is only worked out when DEBUG logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("USD->Token: $%s / $%s = %.2f %s = %d wei",
+                         usd_value, price, float(usd_value) / price, token_symbol, amount_wei)
         
         return amount_wei
     
@@ -212,20 +569,19 @@ class PriceOracle:
         """
         price = self.get_price(token_symbol)
         
-        # Convert from wei
-        token_amount = amount_wei / 10**18
-        
-        # Calculate USD
-        usd_value = token_amount * price
+        # Convert from wei and calculate USD (Decimal, same precision as above)
+        with localcontext() as ctx:
+            ctx.prec = 40
+            usd_value = Decimal(int(amount_wei)) / WEI * Decimal(str(price))
         
-        return usd_value
+        return float(usd_value)
     
     def get_price_by_address(self, address: str) -> float:
         """Get price directly by address"""
         # Check known addresses
-        for symbol, token_addr in self.token_map.items():
-            if token_addr.lower() == address.lower():
-                return self.get_price(symbol)
+        symbol = self.address_to_symbol.get(address.lower())
+        if symbol:
+            return self.get_price(symbol)
         
         # Try DexScreener directly
         price = self._fetch_dexscreener(address)
@@ -6,325 +6,371 @@ All DEX router, factory, and token ABIs organized in one place
 import json
 from typing import Dict, Optional
 
-class ABIManager:
-    """Manages all contract ABIs for DEX interactions"""
-    
-    def __init__(self):
-        # ERC20 Standard ABI
-        self.ERC20_ABI = [
-            {
-                "inputs": [],
-                "name": "name",
-                "outputs": [{"internalType": "string", "name": "", "type": "string"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "symbol",
-                "outputs": [{"internalType": "string", "name": "", "type": "string"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "decimals",
-                "outputs": [{"internalType": "uint8", "name": "", "type": "uint8"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "totalSupply",
-                "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
-                "name": "balanceOf",
-                "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "address", "name": "spender", "type": "address"},
-                    {"internalType": "uint256", "name": "amount", "type": "uint256"}
-                ],
-                "name": "approve",
-                "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "address", "name": "owner", "type": "address"},
-                    {"internalType": "address", "name": "spender", "type": "address"}
-                ],
-                "name": "allowance",
-                "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "address", "name": "recipient", "type": "address"},
-                    {"internalType": "uint256", "name": "amount", "type": "uint256"}
-                ],
-                "name": "transfer",
-                "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            }
-        ]
-        
-        # Uniswap V2 Router ABI (also works for PulseX, PancakeSwap, SushiSwap)
-        self.UNISWAP_V2_ROUTER_ABI = [
-            {
-                "inputs": [],
-                "name": "WETH",
-                "outputs": [{"internalType": "address", "name": "", "type": "address"}],
-                "stateMutability": "pure",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "factory",
-                "outputs": [{"internalType": "address", "name": "", "type": "address"}],
-                "stateMutability": "pure",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
-                    {"internalType": "uint256", "name": "amountOutMin", "type": "uint256"},
-                    {"internalType": "address[]", "name": "path", "type": "address[]"},
-                    {"internalType": "address", "name": "to", "type": "address"},
-                    {"internalType": "uint256", "name": "deadline", "type": "uint256"}
-                ],
-                "name": "swapExactTokensForTokens",
-                "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "uint256", "name": "amountOutMin", "type": "uint256"},
-                    {"internalType": "address[]", "name": "path", "type": "address[]"},
-                    {"internalType": "address", "name": "to", "type": "address"},
-                    {"internalType": "uint256", "name": "deadline", "type": "uint256"}
-                ],
-                "name": "swapExactETHForTokens",
-                "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
-                "stateMutability": "payable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
-                    {"internalType": "uint256", "name": "amountOutMin", "type": "uint256"},
-                    {"internalType": "address[]", "name": "path", "type": "address[]"},
-                    {"internalType": "address", "name": "to", "type": "address"},
-                    {"internalType": "uint256", "name": "deadline", "type": "uint256"}
-                ],
-                "name": "swapExactTokensForETH",
-                "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
-                    {"internalType": "address[]", "name": "path", "type": "address[]"}
-                ],
-                "name": "getAmountsOut",
-                "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "uint256", "name": "amountOut", "type": "uint256"},
-                    {"internalType": "address[]", "name": "path", "type": "address[]"}
-                ],
-                "name": "getAmountsIn",
-                "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
-                    {"internalType": "uint256", "name": "amountOutMin", "type": "uint256"},
-                    {"internalType": "address[]", "name": "path", "type": "address[]"},
-                    {"internalType": "address", "name": "to", "type": "address"},
-                    {"internalType": "uint256", "name": "deadline", "type": "uint256"}
-                ],
-                "name": "swapExactTokensForTokensSupportingFeeOnTransferTokens",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            }
-        ]
-        
-        # Uniswap V2 Factory ABI
-        self.UNISWAP_V2_FACTORY_ABI = [
-            {
-                "inputs": [
-                    {"internalType": "address", "name": "tokenA", "type": "address"},
-                    {"internalType": "address", "name": "tokenB", "type": "address"}
-                ],
-                "name": "getPair",
-                "outputs": [{"internalType": "address", "name": "pair", "type": "address"}],
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
-        
-        # Uniswap V2 Pair ABI
-        self.UNISWAP_V2_PAIR_ABI = [
-            {
-                "inputs": [],
-                "name": "getReserves",
-                "outputs": [
-                    {"internalType": "uint112", "name": "_reserve0", "type": "uint112"},
-                    {"internalType": "uint112", "name": "_reserve1", "type": "uint112"},
-                    {"internalType": "uint32", "name": "_blockTimestampLast", "type": "uint32"}
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "token0",
-                "outputs": [{"internalType": "address", "name": "", "type": "address"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "token1",
-                "outputs": [{"internalType": "address", "name": "", "type": "address"}],
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
-        
-        # Uniswap V3 Router ABI (SwapRouter)
-        self.UNISWAP_V3_ROUTER_ABI = [
-            {
-                "inputs": [
-                    {
-                        "components": [
-                            {"internalType": "address", "name": "tokenIn", "type": "address"},
-                            {"internalType": "address", "name": "tokenOut", "type": "address"},
-                            {"internalType": "uint24", "name": "fee", "type": "uint24"},
-                            {"internalType": "address", "name": "recipient", "type": "address"},
-                            {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                            {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
-                            {"internalType": "uint256", "name": "amountOutMinimum", "type": "uint256"},
-                            {"internalType": "uint160", "name": "sqrtPriceLimitX96", "type": "uint160"}
-                        ],
-                        "internalType": "struct ISwapRouter.ExactInputSingleParams",
-                        "name": "params",
-                        "type": "tuple"
-                    }
-                ],
-                "name": "exactInputSingle",
-                "outputs": [{"internalType": "uint256", "name": "amountOut", "type": "uint256"}],
-                "stateMutability": "payable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "components": [
-                            {"internalType": "bytes", "name": "path", "type": "bytes"},
-                            {"internalType": "address", "name": "recipient", "type": "address"},
-                            {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                            {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
-                            {"internalType": "uint256", "name": "amountOutMinimum", "type": "uint256"}
-                        ],
-                        "internalType": "struct ISwapRouter.ExactInputParams",
-                        "name": "params",
-                        "type": "tuple"
-                    }
-                ],
-                "name": "exactInput",
-                "outputs": [{"internalType": "uint256", "name": "amountOut", "type": "uint256"}],
-                "stateMutability": "payable",
-                "type": "function"
-            }
-        ]
-        
-        # Uniswap V3 Quoter ABI (for price quotes)
-        self.UNISWAP_V3_QUOTER_ABI = [
+# ERC20 Standard ABI
+ERC20_ABI = [
+    {
+        "inputs": [],
+        "name": "name",
+        "outputs": [{"internalType": "string", "name": "", "type": "string"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "symbol",
+        "outputs": [{"internalType": "string", "name": "", "type": "string"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "decimals",
+        "outputs": [{"internalType": "uint8", "name": "", "type": "uint8"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "totalSupply",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "spender", "type": "address"},
+            {"internalType": "uint256", "name": "amount", "type": "uint256"}
+        ],
+        "name": "approve",
+        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "owner", "type": "address"},
+            {"internalType": "address", "name": "spender", "type": "address"}
+        ],
+        "name": "allowance",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "recipient", "type": "address"},
+            {"internalType": "uint256", "name": "amount", "type": "uint256"}
+        ],
+        "name": "transfer",
+        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    }
+]
+
+# Uniswap V2 Router ABI (also works for PulseX, PancakeSwap, SushiSwap)
+UNISWAP_V2_ROUTER_ABI = [
+    {
+        "inputs": [],
+        "name": "WETH",
+        "outputs": [{"internalType": "address", "name": "", "type": "address"}],
+        "stateMutability": "pure",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "factory",
+        "outputs": [{"internalType": "address", "name": "", "type": "address"}],
+        "stateMutability": "pure",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+            {"internalType": "uint256", "name": "amountOutMin", "type": "uint256"},
+            {"internalType": "address[]", "name": "path", "type": "address[]"},
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "deadline", "type": "uint256"}
+        ],
+        "name": "swapExactTokensForTokens",
+        "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "amountOutMin", "type": "uint256"},
+            {"internalType": "address[]", "name": "path", "type": "address[]"},
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "deadline", "type": "uint256"}
+        ],
+        "name": "swapExactETHForTokens",
+        "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
+        "stateMutability": "payable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+            {"internalType": "uint256", "name": "amountOutMin", "type": "uint256"},
+            {"internalType": "address[]", "name": "path", "type": "address[]"},
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "deadline", "type": "uint256"}
+        ],
+        "name": "swapExactTokensForETH",
+        "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+            {"internalType": "address[]", "name": "path", "type": "address[]"}
+        ],
+        "name": "getAmountsOut",
+        "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "amountOut", "type": "uint256"},
+            {"internalType": "address[]", "name": "path", "type": "address[]"}
+        ],
+        "name": "getAmountsIn",
+        "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+            {"internalType": "uint256", "name": "amountOutMin", "type": "uint256"},
+            {"internalType": "address[]", "name": "path", "type": "address[]"},
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "deadline", "type": "uint256"}
+        ],
+        "name": "swapExactTokensForTokensSupportingFeeOnTransferTokens",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    }
+]
+
+# Uniswap V2 Factory ABI
+UNISWAP_V2_FACTORY_ABI = [
+    {
+        "inputs": [
+            {"internalType": "address", "name": "tokenA", "type": "address"},
+            {"internalType": "address", "name": "tokenB", "type": "address"}
+        ],
+        "name": "getPair",
+        "outputs": [{"internalType": "address", "name": "pair", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+# Uniswap V2 Pair ABI
+UNISWAP_V2_PAIR_ABI = [
+    {
+        "inputs": [],
+        "name": "getReserves",
+        "outputs": [
+            {"internalType": "uint112", "name": "_reserve0", "type": "uint112"},
+            {"internalType": "uint112", "name": "_reserve1", "type": "uint112"},
+            {"internalType": "uint32", "name": "_blockTimestampLast", "type": "uint32"}
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "token0",
+        "outputs": [{"internalType": "address", "name": "", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "token1",
+        "outputs": [{"internalType": "address", "name": "", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+# Uniswap V3 Router ABI (SwapRouter)
+UNISWAP_V3_ROUTER_ABI = [
+    {
+        "inputs": [
             {
-                "inputs": [
+                "components": [
                     {"internalType": "address", "name": "tokenIn", "type": "address"},
                     {"internalType": "address", "name": "tokenOut", "type": "address"},
                     {"internalType": "uint24", "name": "fee", "type": "uint24"},
+                    {"internalType": "address", "name": "recipient", "type": "address"},
+                    {"internalType": "uint256", "name": "deadline", "type": "uint256"},
                     {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+                    {"internalType": "uint256", "name": "amountOutMinimum", "type": "uint256"},
                     {"internalType": "uint160", "name": "sqrtPriceLimitX96", "type": "uint160"}
                 ],
-                "name": "quoteExactInputSingle",
-                "outputs": [{"internalType": "uint256", "name": "amountOut", "type": "uint256"}],
-                "stateMutability": "nonpayable",
-                "type": "function"
+                "internalType": "struct ISwapRouter.ExactInputSingleParams",
+                "name": "params",
+                "type": "tuple"
             }
-        ]
-        
-        # WETH ABI (Wrapped ETH / Native token wrapper)
-        self.WETH_ABI = [
-            {
-                "inputs": [],
-                "name": "deposit",
-                "outputs": [],
-                "stateMutability": "payable",
-                "type": "function"
-            },
-            {
-                "inputs": [{"internalType": "uint256", "name": "wad", "type": "uint256"}],
-                "name": "withdraw",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
+        ],
+        "name": "exactInputSingle",
+        "outputs": [{"internalType": "uint256", "name": "amountOut", "type": "uint256"}],
+        "stateMutability": "payable",
+        "type": "function"
+    },
+    {
+        "inputs": [
             {
-                "inputs": [],
-                "name": "totalSupply",
-                "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
-                "name": "balanceOf",
-                "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-                "stateMutability": "view",
-                "type": "function"
+                "components": [
+                    {"internalType": "bytes", "name": "path", "type": "bytes"},
+                    {"internalType": "address", "name": "recipient", "type": "address"},
+                    {"internalType": "uint256", "name": "deadline", "type": "uint256"},
+                    {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+                    {"internalType": "uint256", "name": "amountOutMinimum", "type": "uint256"}
+                ],
+                "internalType": "struct ISwapRouter.ExactInputParams",
+                "name": "params",
+                "type": "tuple"
             }
-        ]
+        ],
+        "name": "exactInput",
+        "outputs": [{"internalType": "uint256", "name": "amountOut", "type": "uint256"}],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+# Uniswap V3 Quoter ABI (for price quotes)
+UNISWAP_V3_QUOTER_ABI = [
+    {
+        "inputs": [
+            {"internalType": "address", "name": "tokenIn", "type": "address"},
+            {"internalType": "address", "name": "tokenOut", "type": "address"},
+            {"internalType": "uint24", "name": "fee", "type": "uint24"},
+            {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+            {"internalType": "uint160", "name": "sqrtPriceLimitX96", "type": "uint160"}
+        ],
+        "name": "quoteExactInputSingle",
+        "outputs": [{"internalType": "uint256", "name": "amountOut", "type": "uint256"}],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    }
+]
+
+# WETH ABI (Wrapped ETH / Native token wrapper)
+WETH_ABI = [
+    {
+        "inputs": [],
+        "name": "deposit",
+        "outputs": [],
+        "stateMutability": "payable",
+        "type": "function"
+    },
+    {
+        "inputs": [{"internalType": "uint256", "name": "wad", "type": "uint256"}],
+        "name": "withdraw",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "totalSupply",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+# Contract type -> ABI lookup table (built once at import)
+_ABI_TABLE = {
+    'erc20': ERC20_ABI,
+    'uniswap_v2_router': UNISWAP_V2_ROUTER_ABI,
+    'uniswap_v2_factory': UNISWAP_V2_FACTORY_ABI,
+    'uniswap_v2_pair': UNISWAP_V2_PAIR_ABI,
+    'uniswap_v3_router': UNISWAP_V3_ROUTER_ABI,
+    'uniswap_v3_quoter': UNISWAP_V3_QUOTER_ABI,
+    'pulsex_router': UNISWAP_V2_ROUTER_ABI,  # PulseX uses V2 ABI
+    'pancake_router': UNISWAP_V2_ROUTER_ABI,  # PancakeSwap uses V2 ABI
+    'sushi_router': UNISWAP_V2_ROUTER_ABI,  # SushiSwap uses V2 ABI
+    'weth': WETH_ABI,
+    'wpls': WETH_ABI,  # WPLS uses same ABI as WETH
+    'wbnb': WETH_ABI   # WBNB uses same ABI as WETH
+}
+
+# Functions each contract type is actually called with (slim ABIs only carry these)
+_SLIM_METHODS = {
+    'uniswap_v2_router': {'getAmountsOut', 'swapExactTokensForTokens', 'swapExactETHForTokens', 'swapExactTokensForETH'},
+    'uniswap_v2_factory': {'getPair'},
+    'uniswap_v2_pair': {'getReserves', 'token0', 'token1'},
+    'uniswap_v3_router': {'exactInputSingle'},
+    'uniswap_v3_quoter': {'quoteExactInputSingle'}
+}
+
+def _filter_abi(abi: list, methods) -> list:
+    """Keep only the ABI entries whose name is in methods"""
+    return [entry for entry in abi if entry.get('name') in methods]
+
+# Slim variants - web3 compiles every ABI entry, so fewer entries = cheaper contracts
+_SLIM_ABI_TABLE = {
+    'uniswap_v2_router': _filter_abi(UNISWAP_V2_ROUTER_ABI, _SLIM_METHODS['uniswap_v2_router']),
+    'uniswap_v2_factory': _filter_abi(UNISWAP_V2_FACTORY_ABI, _SLIM_METHODS['uniswap_v2_factory']),
+    'uniswap_v2_pair': _filter_abi(UNISWAP_V2_PAIR_ABI, _SLIM_METHODS['uniswap_v2_pair']),
+    'uniswap_v3_router': _filter_abi(UNISWAP_V3_ROUTER_ABI, _SLIM_METHODS['uniswap_v3_router']),
+    'uniswap_v3_quoter': _filter_abi(UNISWAP_V3_QUOTER_ABI, _SLIM_METHODS['uniswap_v3_quoter'])
+}
+for _alias in ('pulsex_router', 'pancake_router', 'sushi_router'):
+    _SLIM_ABI_TABLE[_alias] = _SLIM_ABI_TABLE['uniswap_v2_router']
+
+class ABIManager:
+    """Manages all contract ABIs for DEX interactions"""
     
-    def get_abi(self, contract_type: str) -> Optional[list]:
-        """Get ABI by contract type"""
-        abis = {
-            'erc20': self.ERC20_ABI,
-            'uniswap_v2_router': self.UNISWAP_V2_ROUTER_ABI,
-            'uniswap_v2_factory': self.UNISWAP_V2_FACTORY_ABI,
-            'uniswap_v2_pair': self.UNISWAP_V2_PAIR_ABI,
-            'uniswap_v3_router': self.UNISWAP_V3_ROUTER_ABI,
-            'uniswap_v3_quoter': self.UNISWAP_V3_QUOTER_ABI,
-            'pulsex_router': self.UNISWAP_V2_ROUTER_ABI,  # PulseX uses V2 ABI
-            'pancake_router': self.UNISWAP_V2_ROUTER_ABI,  # PancakeSwap uses V2 ABI
-            'sushi_router': self.UNISWAP_V2_ROUTER_ABI,  # SushiSwap uses V2 ABI
-            'weth': self.WETH_ABI,
-            'wpls': self.WETH_ABI,  # WPLS uses same ABI as WETH
-            'wbnb': self.WETH_ABI   # WBNB uses same ABI as WETH
-        }
-        
-        return abis.get(contract_type.lower())
+    # ABIs are module-level constants, shared by every instance
+    ERC20_ABI = ERC20_ABI
+    UNISWAP_V2_ROUTER_ABI = UNISWAP_V2_ROUTER_ABI
+    UNISWAP_V2_FACTORY_ABI = UNISWAP_V2_FACTORY_ABI
+    UNISWAP_V2_PAIR_ABI = UNISWAP_V2_PAIR_ABI
+    UNISWAP_V3_ROUTER_ABI = UNISWAP_V3_ROUTER_ABI
+    UNISWAP_V3_QUOTER_ABI = UNISWAP_V3_QUOTER_ABI
+    WETH_ABI = WETH_ABI
+    
+    UNISWAP_V2_ROUTER_ABI_SLIM = _SLIM_ABI_TABLE['uniswap_v2_router']
+    UNISWAP_V2_FACTORY_ABI_SLIM = _SLIM_ABI_TABLE['uniswap_v2_factory']
+    UNISWAP_V2_PAIR_ABI_SLIM = _SLIM_ABI_TABLE['uniswap_v2_pair']
+    UNISWAP_V3_ROUTER_ABI_SLIM = _SLIM_ABI_TABLE['uniswap_v3_router']
+    UNISWAP_V3_QUOTER_ABI_SLIM = _SLIM_ABI_TABLE['uniswap_v3_quoter']
+    
+    def get_abi(self, contract_type: str, slim: bool = False) -> Optional[list]:
+        """
+        Get ABI by contract type
+        slim=True returns only the functions the bot calls (falls back to the full ABI)
+        """
+        # Callers almost always pass the lowercase key already - skip the .lower() copy then
+        key = contract_type if contract_type in _ABI_TABLE else contract_type.lower()
+        if slim and key in _SLIM_ABI_TABLE:
+            return _SLIM_ABI_TABLE[key]
+        return _ABI_TABLE.get(key)
     
     def get_router_abi(self, dex: str) -> list:
         """Get router ABI for specific DEX"""
@@ -5,96 +5,83 @@ FIXED: Proper swap_executor initialization
 NEW: Better error handling and module availability checking
 """
 
-import sys
-from pathlib import Path
+import importlib
+import importlib.util
 
-# Add src to path
-src_path = Path(__file__).parent / 'src'
-if src_path.exists() and str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
-
-from web3 import Web3
-from typing import Dict, Optional
+from typing import Dict, Optional, TYPE_CHECKING
 import json
 
-# FIXED: Import from v4 files (they were never renamed to v6/v7)
-try:
-    from wallet_manager_v4 import WalletManager
-    WALLET_MANAGER_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ wallet_manager_v4.py not available: {e}")
-    WalletManager = None
-    WALLET_MANAGER_AVAILABLE = False
-
-try:
-    from dex_router_v4 import DEXRouter
-    DEX_ROUTER_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ dex_router_v4.py not available: {e}")
-    DEXRouter = None
-    DEX_ROUTER_AVAILABLE = False
-
-try:
-    from swap_executor_v4 import SwapExecutor
-    SWAP_EXECUTOR_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ swap_executor_v4.py not available: {e}")
-    SwapExecutor = None
-    SWAP_EXECUTOR_AVAILABLE = False
+if TYPE_CHECKING:
+    from web3 import Web3  # annotation only - web3 is imported by the modules that use it
 
-try:
-    from token_scanner_v4 import TokenScanner
-    TOKEN_SCANNER_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ token_scanner_v4.py not available: {e}")
-    TokenScanner = None
-    TOKEN_SCANNER_AVAILABLE = False
-
-try:
-    from state_manager_v4 import StateManager
-    STATE_MANAGER_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ state_manager_v4.py not available: {e}")
-    StateManager = None
-    STATE_MANAGER_AVAILABLE = False
+# FIXED: Import from v4 files (they were never renamed to v6/v7)
+# Modules are imported lazily on first use (PEP 562) - callers that only need
+# one or two of them no longer pay for importing all nine at startup
+#
+# One row per module: (exported name, module, status label, critical), in display order
+_MODULES = (
+    ('WalletManager', 'wallet_manager_v4', 'Wallet Manager', True),
+    ('DEXRouter', 'dex_router_v4', 'DEX Router', True),
+    ('SwapExecutor', 'swap_executor_v4', 'Swap Executor', True),
+    ('TokenScanner', 'token_scanner_v4', 'Token Scanner', False),
+    ('StateManager', 'state_manager_v4', 'State Manager', False),
+    ('abi_manager', 'abi_manager_v4', 'ABI Manager', True),  # FIXED: Import abi_manager from v4 (correct filename)
+    ('SlippageCalculator', 'slippage_calculator_v4', 'Slippage Calculator', False),
+    ('TransactionManager', 'transaction_manager_v4', 'Transaction Manager', False),
+    ('RouteOptimizer', 'route_optimizer_v4', 'Route Optimizer', False)
+)
 
-# FIXED: Import abi_manager from v4 (correct filename)
-try:
-    from abi_manager_v4 import abi_manager
-    ABI_MANAGER_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ abi_manager_v4.py not available: {e}")
-    abi_manager = None
-    ABI_MANAGER_AVAILABLE = False
+# Lazy name -> module, and availability flag (e.g. DEX_ROUTER_AVAILABLE) -> module
+_LAZY = {name: module_name for name, module_name, _, _ in _MODULES}
+_AVAILABILITY_FLAGS = {
+    module_name.rsplit('_v', 1)[0].upper() + '_AVAILABLE': module_name
+    for _, module_name, _, _ in _MODULES
+}
+_availability_cache = {}
 
-try:
-    from slippage_calculator_v4 import SlippageCalculator
-    SLIPPAGE_CALCULATOR_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ slippage_calculator_v4.py not available: {e}")
-    SlippageCalculator = None
-    SLIPPAGE_CALCULATOR_AVAILABLE = False
+def _module_available(module_name: str) -> bool:
+    """Check if a module can be imported (find_spec does not execute it)"""
+    if module_name not in _availability_cache:
+        try:
+            _availability_cache[module_name] = importlib.util.find_spec(module_name) is not None
+        except (ImportError, ValueError):
+            _availability_cache[module_name] = False
+    return _availability_cache[module_name]
 
-try:
-    from transaction_manager_v4 import TransactionManager
-    TRANSACTION_MANAGER_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ transaction_manager_v4.py not available: {e}")
-    TransactionManager = None
-    TRANSACTION_MANAGER_AVAILABLE = False
+def _load(name: str):
+    """Import a lazy class/object on first use (None if its module fails to import)"""
+    if name in globals():
+        return globals()[name]
+    
+    module_name = _LAZY[name]
+    try:
+        obj = getattr(importlib.import_module(module_name), name)
+    except ImportError as e:
+        print(f"⚠️ {module_name}.py not available: {e}")
+        obj = None
+    
+    globals()[name] = obj
+    return obj
 
-try:
-    from route_optimizer_v4 import RouteOptimizer
-    ROUTE_OPTIMIZER_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ route_optimizer_v4.py not available: {e}")
-    RouteOptimizer = None
-    ROUTE_OPTIMIZER_AVAILABLE = False
+def __getattr__(name: str):
+    """PEP 562 hook: resolve lazy classes and *_AVAILABLE flags on attribute access"""
+    if name in _LAZY:
+        return _load(name)
+    if name in _AVAILABILITY_FLAGS:
+        return _module_available(_AVAILABILITY_FLAGS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class BackendModules:
     """Central class to manage all backend modules - v7 fixed version"""
     
-    def __init__(self, web3_instance: Web3 = None, network: str = 'pulsechain'):
+    # Fixed attribute set - no per-instance __dict__
+    __slots__ = (
+        'web3', 'network',
+        'wallet_manager', 'dex_router', 'swap_executor', 'token_scanner',
+        'state_manager', 'slippage_calculator', 'transaction_manager', 'route_optimizer'
+    )
+    
+    def __init__(self, web3_instance: 'Web3' = None, network: str = 'pulsechain'):
         self.web3 = web3_instance
         self.network = network
         
@@ -107,26 +94,33 @@ class BackendModules:
         self.slippage_calculator = None
         self.transaction_manager = None
         self.route_optimizer = None
-        self.abi_manager = abi_manager  # FIXED: Direct reference
         
         # Initialize modules
         self.initialize_modules()
     
+    @property
+    def abi_manager(self):
+        """Shared ABI manager, imported on first access (status checks never need it)"""
+        return _load('abi_manager')
+    
     def initialize_modules(self):
         """Initialize all available modules with proper error handling"""
         try:
             # Core modules that don't require Web3
-            if WALLET_MANAGER_AVAILABLE:
+            WalletManager = _load('WalletManager')
+            if WalletManager:
                 self.wallet_manager = WalletManager()
                 print("✅ Wallet Manager initialized")
             
-            if STATE_MANAGER_AVAILABLE:
+            StateManager = _load('StateManager')
+            if StateManager:
                 self.state_manager = StateManager()
                 print("✅ State Manager initialized")
             
             # Modules that require Web3
             if self.web3:
-                if DEX_ROUTER_AVAILABLE:
+                DEXRouter = _load('DEXRouter')
+                if DEXRouter:
                     try:
                         self.dex_router = DEXRouter(self.web3, self.network)
                         print("✅ DEX Router initialized")
@@ -134,7 +128,8 @@ class BackendModules:
                         print(f"⚠️ DEX Router init error: {e}")
                 
                 # FIXED: Proper swap_executor initialization
-                if SWAP_EXECUTOR_AVAILABLE:
+                SwapExecutor = _load('SwapExecutor')
+                if SwapExecutor:
                     try:
                         self.swap_executor = SwapExecutor(
                             self.web3,
@@ -145,28 +140,32 @@ class BackendModules:
                     except Exception as e:
                         print(f"⚠️ Swap Executor init error: {e}")
                 
-                if TOKEN_SCANNER_AVAILABLE:
+                TokenScanner = _load('TokenScanner')
+                if TokenScanner:
                     try:
                         self.token_scanner = TokenScanner(self.web3)
                         print("✅ Token Scanner initialized")
                     except Exception as e:
                         print(f"⚠️ Token Scanner init error: {e}")
                 
-                if SLIPPAGE_CALCULATOR_AVAILABLE:
+                SlippageCalculator = _load('SlippageCalculator')
+                if SlippageCalculator:
                     try:
                         self.slippage_calculator = SlippageCalculator(self.web3, self.network)
                         print("✅ Slippage Calculator initialized")
                     except Exception as e:
                         print(f"⚠️ Slippage Calculator init error: {e}")
                 
-                if TRANSACTION_MANAGER_AVAILABLE:
+                TransactionManager = _load('TransactionManager')
+                if TransactionManager:
                     try:
                         self.transaction_manager = TransactionManager(self.web3, self.network)
                         print("✅ Transaction Manager initialized")
                     except Exception as e:
                         print(f"⚠️ Transaction Manager init error: {e}")
                 
-                if ROUTE_OPTIMIZER_AVAILABLE:
+                RouteOptimizer = _load('RouteOptimizer')
+                if RouteOptimizer:
                     try:
                         self.route_optimizer = RouteOptimizer(self.web3, self.network)
                         print("✅ Route Optimizer initialized")
@@ -180,15 +179,15 @@ class BackendModules:
         """Get status of all modules"""
         return {
             'core_modules': {
-                'wallet_manager': WALLET_MANAGER_AVAILABLE and self.wallet_manager is not None,
-                'dex_router': DEX_ROUTER_AVAILABLE and self.dex_router is not None,
-                'swap_executor': SWAP_EXECUTOR_AVAILABLE and self.swap_executor is not None,
-                'token_scanner': TOKEN_SCANNER_AVAILABLE and self.token_scanner is not None,
-                'state_manager': STATE_MANAGER_AVAILABLE and self.state_manager is not None,
-                'abi_manager': ABI_MANAGER_AVAILABLE and self.abi_manager is not None,
-                'slippage_calculator': SLIPPAGE_CALCULATOR_AVAILABLE and self.slippage_calculator is not None,
-                'transaction_manager': TRANSACTION_MANAGER_AVAILABLE and self.transaction_manager is not None,
-                'route_optimizer': ROUTE_OPTIMIZER_AVAILABLE and self.route_optimizer is not None
+                'wallet_manager': self.wallet_manager is not None,
+                'dex_router': self.dex_router is not None,
+                'swap_executor': self.swap_executor is not None,
+                'token_scanner': self.token_scanner is not None,
+                'state_manager': self.state_manager is not None,
+                'abi_manager': self.abi_manager is not None,
+                'slippage_calculator': self.slippage_calculator is not None,
+                'transaction_manager': self.transaction_manager is not None,
+                'route_optimizer': self.route_optimizer is not None
             }
         }
     
@@ -214,31 +213,25 @@ class BackendModules:
         
         return missing
 
+def get_available_modules() -> Dict[str, bool]:
+    """Module name -> available (find_spec only, nothing is imported or executed)"""
+    return {module_name: _module_available(module_name) for _, module_name, _, _ in _MODULES}
+
 def check_module_availability():
     """Print status of all modules"""
+    available = get_available_modules()
+    
     print("\n" + "="*60)
     print("BACKEND MODULES V7 - STATUS CHECK")
     print("="*60)
     
     print("\n✅ CORE MODULES:")
-    print(f"  {'Wallet Manager:':<25} {'✅' if WALLET_MANAGER_AVAILABLE else '❌'}")
-    print(f"  {'DEX Router:':<25} {'✅' if DEX_ROUTER_AVAILABLE else '❌'}")
-    print(f"  {'Swap Executor:':<25} {'✅' if SWAP_EXECUTOR_AVAILABLE else '❌'}")
-    print(f"  {'Token Scanner:':<25} {'✅' if TOKEN_SCANNER_AVAILABLE else '❌'}")
-    print(f"  {'State Manager:':<25} {'✅' if STATE_MANAGER_AVAILABLE else '❌'}")
-    print(f"  {'ABI Manager:':<25} {'✅' if ABI_MANAGER_AVAILABLE else '❌'}")
-    print(f"  {'Slippage Calculator:':<25} {'✅' if SLIPPAGE_CALCULATOR_AVAILABLE else '❌'}")
-    print(f"  {'Transaction Manager:':<25} {'✅' if TRANSACTION_MANAGER_AVAILABLE else '❌'}")
-    print(f"  {'Route Optimizer:':<25} {'✅' if ROUTE_OPTIMIZER_AVAILABLE else '❌'}")
+    for _, module_name, label, _ in _MODULES:
+        print(f"  {label + ':':<25} {'✅' if available[module_name] else '❌'}")
     
     print("\n" + "="*60)
     
-    critical_ok = all([
-        WALLET_MANAGER_AVAILABLE,
-        DEX_ROUTER_AVAILABLE,
-        SWAP_EXECUTOR_AVAILABLE,
-        ABI_MANAGER_AVAILABLE
-    ])
+    critical_ok = all(available[module_name] for _, module_name, _, critical in _MODULES if critical)
     
     if critical_ok:
         print("✅ All critical modules are available!")
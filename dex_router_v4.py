@@ -10,46 +10,186 @@ REPLACE YOUR CURRENT dex_router_v4.py WITH THIS FILE
 """
 
 import sys
+import importlib.util
 from pathlib import Path
 
-# Add src to path
-src_path = Path(__file__).parent / 'src'
-if src_path.exists() and str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
-
 from web3 import Web3
 from typing import Dict, List, Optional, Tuple
 import json
 import time
-from abi_manager_v4 import abi_manager
+import copy
+import functools
+import logging
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+def _lazy_module(name: str):
+    """Import a module lazily - its body only runs on first attribute access"""
+    if name in sys.modules:
+        return sys.modules[name]
+    
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+log = logging.getLogger(__name__)
+
+# ABIs are only loaded when the first contract is built
+_abi_module = _lazy_module('abi_manager_v4')
+
+NETWORKS_FILE = Path(__file__).parent / 'networks_v4.json'
+
+@functools.lru_cache(maxsize=1024)
+def _cs(address: str) -> str:
+    """Checksum an address, memoized (each conversion costs a keccak; wallets/tokens repeat)"""
+    return Web3.to_checksum_address(address)
+
+# One private batching Web3 per (thread, shared provider) - see _batch_call
+_batch_local = threading.local()
+
+def _batch_web3(web3: Web3) -> Web3:
+    """
+    This thread's private Web3 for batch_requests(), a clone of web3's HTTP provider:
+    same endpoint, pooled session, request kwargs (timeout/headers), retries and middleware
+    """
+    provider = web3.provider
+    endpoint = provider.endpoint_uri  # non-HTTP providers raise here -> callers fall back
+    instances = getattr(_batch_local, 'instances', None)
+    if instances is None:
+        instances = _batch_local.instances = weakref.WeakKeyDictionary()
+    batch_web3 = instances.get(provider)
+    if batch_web3 is None:
+        # The session web3 hands this thread for the shared provider (the caller's, if it passed one)
+        session = provider._request_session_manager.cache_and_return_session(endpoint)
+        batch_provider = Web3.HTTPProvider(
+            endpoint,
+            request_kwargs=provider._request_kwargs,
+            session=session,
+            exception_retry_configuration=provider.exception_retry_configuration
+        )
+        batch_web3 = instances[provider] = Web3(batch_provider, middleware=web3.middleware_onion.middleware)
+    return batch_web3
+
+def _batch_call(web3: Web3, calls: list) -> list:
+    """
+    Run bound ContractFunctions as one JSON-RPC batch -> list of decoded results
+    web3 7.x batch_requests() flags the whole provider as batching, so doing it on the
+    shared instance would hand other threads' calls back unsent. Batches run on a
+    per-thread provider instead; each call is rebound to it on a shallow copy.
+    """
+    batch_web3 = _batch_web3(web3)
+    with batch_web3.batch_requests() as batch:
+        for fn in calls:
+            batch_fn = copy.copy(fn)
+            batch_fn.w3 = batch_web3
+            batch.add(batch_fn)
+        return batch.execute()
+
+@functools.lru_cache(maxsize=4096)
+def _cached_swap_path(token_in: str, token_out: str, wrapped_token: str) -> Tuple[str, ...]:
+    """Build a swap path (see DEXRouter.build_swap_path), cached per token pair"""
+    wrapped_token_address = _cs(wrapped_token)
+    
+    # 🔧 FIX: For path queries, use WPLS address for native
+    # But the calling code should track which is actually native
+    if token_in in ['native', 'PLS', 'ETH']:
+        token_in_addr = wrapped_token_address
+    else:
+        token_in_addr = _cs(token_in)
+        
+    if token_out in ['native', 'PLS', 'ETH']:
+        token_out_addr = wrapped_token_address
+    else:
+        token_out_addr = _cs(token_out)
+    
+    # Direct path
+    if token_in_addr == wrapped_token_address or token_out_addr == wrapped_token_address:
+        return (token_in_addr, token_out_addr)
+    
+    # Route through wrapped token
+    return (token_in_addr, wrapped_token_address, token_out_addr)
+
+PRIORITY_FEE_WEI = 2 * 10**9  # 2 gwei tip
+GAS_PRICE_TTL = 2  # seconds (PulseChain blocks are ~10s)
+
+def _normalize_config(config) -> Dict:
+    """Checksum router/factory/wrapped token addresses once, at load time"""
+    config = dict(config)
+    
+    dexs = {}
+    for dex_name, dex_config in config.get('dexs', {}).items():
+        dex_config = dict(dex_config)
+        for key in ('router', 'factory'):
+            if dex_config.get(key):
+                dex_config[key] = _cs(dex_config[key])
+        dexs[dex_name] = dex_config
+    config['dexs'] = dexs
+    
+    if config.get('wrapped_token'):
+        config['wrapped_token'] = _cs(config['wrapped_token'])
+    
+    return config
+
+@functools.lru_cache(maxsize=8)
+def _load_network_file(network: str, mtime_ns: int):
+    """Read one network from networks_v4.json (cached until the file's mtime changes)"""
+    with open(NETWORKS_FILE, 'r') as f:
+        all_networks = json.load(f)
+    # Read-only view: the same object is shared by every DEXRouter
+    return MappingProxyType(_normalize_config(all_networks.get(network, {})))
 
 class DEXRouter:
     """Universal DEX router - FULLY FIXED FOR PLS/WPLS"""
     
+    # Fixed attribute set - no per-instance __dict__
+    __slots__ = (
+        'web3', 'network', 'network_config',
+        'routers', '_router_fns', 'factories', '_pair_contracts',
+        '_pair_addresses', '_pair_tokens', '_gas_cache'
+    )
+    
     def __init__(self, web3_instance: Web3, network: str):
         self.web3 = web3_instance
         self.network = network
-        self.abi_manager = abi_manager
         
         # Load network configuration
         self.network_config = self.load_network_config(network)
         
-        # Router contracts cache
+        # Router / factory / pair contracts cache
         self.routers = {}
+        self._router_fns = {}  # dex -> {function name: bound ContractFunction}
         self.factories = {}
+        self._pair_contracts = {}
         
+        # V2 pairs never change address or tokens once created - cache them for good
+        self._pair_addresses = {}  # (dex, token_a lower, token_b lower) -> pair address
+        self._pair_tokens = {}  # pair address -> (token0, token1)
+        
+        # (fetched_at monotonic, max fee) - base fee only changes once per block
+        self._gas_cache = (0.0, None)
+    
+    @property
+    def abi_manager(self):
+        """Shared ABI manager (first access runs abi_manager_v4)"""
+        return _abi_module.abi_manager
+    
     def load_network_config(self, network: str) -> Dict:
         """Load network configuration from networks_v4.json"""
         try:
-            networks_file = Path(__file__).parent / 'networks_v4.json'
-            if networks_file.exists():
-                with open(networks_file, 'r') as f:
-                    all_networks = json.load(f)
-                    return all_networks.get(network, {})
+            # One stat() per call, the file is only parsed again after it changes
+            return _load_network_file(network, NETWORKS_FILE.stat().st_mtime_ns)
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            print(f"Error loading network config: {e}")
+            log.warning("Error loading network config: %s", e)
         
-        return self.get_default_config(network)
+        return _normalize_config(self.get_default_config(network))
     
     def get_default_config(self, network: str) -> Dict:
         """Get default configuration"""
@@ -82,45 +222,113 @@ class DEXRouter:
         if not dex_config:
             raise ValueError(f"DEX {dex} not found in {self.network} configuration")
         
-        router_address = dex_config['router']
-        abi = self.abi_manager.get_abi('uniswap_v2_router')
+        abi = self.abi_manager.get_abi('uniswap_v2_router', slim=True)
         
+        # Router address was checksummed when the config was loaded
         contract = self.web3.eth.contract(
-            address=Web3.to_checksum_address(router_address),
+            address=dex_config['router'],
             abi=abi
         )
         
         self.routers[dex] = contract
+        
+        # Bind the router functions we call once, instead of resolving them per swap
+        self._router_fns[dex] = {
+            name: getattr(contract.functions, name)
+            for name in ('getAmountsOut', 'swapExactETHForTokens',
+                         'swapExactTokensForETH', 'swapExactTokensForTokens')
+        }
+        return contract
+    
+    def get_router_functions(self, dex: str) -> Dict:
+        """Get the bound router functions for a DEX (name -> ContractFunction)"""
+        fns = self._router_fns.get(dex)
+        if fns is None:
+            self.get_router_contract(dex)
+            fns = self._router_fns[dex]
+        return fns
+    
+    def get_factory_contract(self, dex: str):
+        """Get factory contract instance (None if the DEX has no factory configured)"""
+        if dex in self.factories:
+            return self.factories[dex]
+        
+        factory_address = self.network_config.get('dexs', {}).get(dex, {}).get('factory')
+        if not factory_address:
+            return None
+        
+        # Factory address was checksummed when the config was loaded
+        contract = self.web3.eth.contract(
+            address=factory_address,
+            abi=self.abi_manager.get_abi('uniswap_v2_factory', slim=True)
+        )
+        
+        self.factories[dex] = contract
+        return contract
+    
+    def get_pair_contract(self, pair_address: str):
+        """Get pair contract instance (pair_address as returned by getPair)"""
+        contract = self._pair_contracts.get(pair_address)
+        if contract is None:
+            contract = self.web3.eth.contract(
+                address=pair_address,
+                abi=self.abi_manager.get_abi('uniswap_v2_pair', slim=True)
+            )
+            self._pair_contracts[pair_address] = contract
         return contract
     
     def get_proper_gas_price(self) -> int:
-        """Proper gas price for PulseChain EIP-1559"""
+        """Proper gas price for PulseChain EIP-1559 (cached for GAS_PRICE_TTL seconds)"""
+        fetched_at, cached_fee = self._gas_cache
+        if cached_fee is not None and time.monotonic() - fetched_at < GAS_PRICE_TTL:
+            return cached_fee
+        
         try:
             latest_block = self.web3.eth.get_block('latest')
             base_fee = latest_block.get('baseFeePerGas', 0)
             
             if base_fee == 0:
-                return self.web3.eth.gas_price
-            
-            priority_fee = self.web3.to_wei(2, 'gwei')
-            max_fee_per_gas = (base_fee * 2) + priority_fee
+                max_fee_per_gas = self.web3.eth.gas_price
+            else:
+                max_fee_per_gas = (base_fee * 2) + PRIORITY_FEE_WEI
             
+            self._gas_cache = (time.monotonic(), max_fee_per_gas)
             return max_fee_per_gas
             
         except Exception as e:
-            print(f"   ⚠️ Gas calc error: {e}, using fallback")
+            log.warning("Gas calc error: %s, using fallback", e)
             return self.web3.eth.gas_price
     
     def get_amounts_out(self, dex: str, amount_in: int, path: List[str]) -> List[int]:
         """Get expected output amounts"""
         try:
-            router = self.get_router_contract(dex)
-            checksum_path = [Web3.to_checksum_address(addr) for addr in path]
-            amounts = router.functions.getAmountsOut(amount_in, checksum_path).call()
+            get_amounts_out = self.get_router_functions(dex)['getAmountsOut']
+            checksum_path = [_cs(addr) for addr in path]
+            amounts = get_amounts_out(amount_in, checksum_path).call()
             return amounts
         except Exception as e:
-            print(f"   ❌ Error getting amounts: {e}")
+            log.warning("Error getting amounts: %s", e)
+            return []
+    
+    def get_amounts_out_batch(self, queries: List[Tuple[str, int, List[str]]]) -> List[List[int]]:
+        """
+        Quote many (dex, amount_in, path) at once -> list of amounts ([] where a quote failed)
+        Sent as one JSON-RPC batch; falls back to concurrent single calls if batching fails
+        """
+        if not queries:
             return []
+        
+        try:
+            results = _batch_call(self.web3, [
+                self.get_router_functions(dex)['getAmountsOut'](amount_in, [_cs(addr) for addr in path])
+                for dex, amount_in, path in queries
+            ])
+            return [list(amounts) for amounts in results]
+        except Exception as e:
+            log.debug("Batched quote failed (%s), querying one by one", e)
+        
+        with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+            return list(pool.map(lambda query: self.get_amounts_out(*query), queries))
     
     def build_swap_path(self, token_in: str, token_out: str, wrapped_token: str = None) -> List[str]:
         """
@@ -134,26 +342,50 @@ class DEXRouter:
         if not wrapped_token:
             wrapped_token = self.network_config.get('wrapped_token')
         
-        wrapped_token_address = Web3.to_checksum_address(wrapped_token)
-        
-        # 🔧 FIX: For path queries, use WPLS address for native
-        # But the calling code should track which is actually native
-        if token_in in ['native', 'PLS', 'ETH']:
-            token_in_addr = wrapped_token_address
-        else:
-            token_in_addr = Web3.to_checksum_address(token_in)
-            
-        if token_out in ['native', 'PLS', 'ETH']:
-            token_out_addr = wrapped_token_address
-        else:
-            token_out_addr = Web3.to_checksum_address(token_out)
+        # Pure function of its inputs - memoized so repeat pairs skip the checksum work
+        return list(_cached_swap_path(token_in, token_out, wrapped_token))
+    
+    def _swap_function(
+        self,
+        router_fns: Dict,
+        path: List[str],
+        amount_in: int,
+        amount_out_min: int,
+        recipient: str,
+        deadline: int,
+        is_native_in: bool,
+        is_native_out: bool
+    ) -> Tuple:
+        """Pick the router swap function for the native flags -> (bound function, tx value)"""
+        # 🔧 FIX: Choose correct router function based on native status
+        if is_native_in:
+            # Native PLS → Token (use swapExactETHForTokens)
+            log.debug("Using swapExactETHForTokens")
+            return router_fns['swapExactETHForTokens'](
+                amount_out_min, path, recipient, deadline
+            ), amount_in
         
-        # Direct path
-        if token_in_addr == wrapped_token_address or token_out_addr == wrapped_token_address:
-            return [token_in_addr, token_out_addr]
+        if is_native_out:
+            # Token → Native PLS (use swapExactTokensForETH)
+            log.debug("Using swapExactTokensForETH")
+            return router_fns['swapExactTokensForETH'](
+                amount_in, amount_out_min, path, recipient, deadline
+            ), 0
         
-        # Route through wrapped token
-        return [token_in_addr, wrapped_token_address, token_out_addr]
+        # Token → Token (use swapExactTokensForTokens)
+        log.debug("Using swapExactTokensForTokens")
+        return router_fns['swapExactTokensForTokens'](
+            amount_in, amount_out_min, path, recipient, deadline
+        ), 0
+    
+    def _estimate_gas(self, tx: Dict, is_native_in: bool = False) -> int:
+        """Estimate gas for a built transaction (+20% buffer, fixed fallback on failure)"""
+        try:
+            estimated_gas = self.web3.eth.estimate_gas(tx)
+            return int(estimated_gas * 1.2)  # 20% buffer
+        except Exception as e:
+            log.warning("Gas estimation failed: %s", e)
+            return 250000 if is_native_in else 300000
     
     def estimate_gas_for_swap(
         self,
@@ -169,51 +401,30 @@ class DEXRouter:
     ) -> int:
         """Estimate gas with proper error handling"""
         try:
-            router = self.get_router_contract(dex)
+            recipient = _cs(recipient)
+            router_fns = self.get_router_functions(dex)
             path = self.build_swap_path(token_in, token_out)
             
-            # Build tx for estimation
-            if is_native_in:
-                tx = router.functions.swapExactETHForTokens(
-                    amount_out_min, path,
-                    Web3.to_checksum_address(recipient),
-                    deadline
-                ).build_transaction({
-                    'from': Web3.to_checksum_address(recipient),
-                    'value': amount_in,
-                    'gas': 300000,
-                    'maxFeePerGas': self.get_proper_gas_price(),
-                    'maxPriorityFeePerGas': self.web3.to_wei(2, 'gwei')
-                })
-            elif is_native_out:
-                tx = router.functions.swapExactTokensForETH(
-                    amount_in, amount_out_min, path,
-                    Web3.to_checksum_address(recipient),
-                    deadline
-                ).build_transaction({
-                    'from': Web3.to_checksum_address(recipient),
-                    'gas': 300000,
-                    'maxFeePerGas': self.get_proper_gas_price(),
-                    'maxPriorityFeePerGas': self.web3.to_wei(2, 'gwei')
-                })
-            else:
-                tx = router.functions.swapExactTokensForTokens(
-                    amount_in, amount_out_min, path,
-                    Web3.to_checksum_address(recipient),
-                    deadline
-                ).build_transaction({
-                    'from': Web3.to_checksum_address(recipient),
-                    'gas': 300000,
-                    'maxFeePerGas': self.get_proper_gas_price(),
-                    'maxPriorityFeePerGas': self.web3.to_wei(2, 'gwei')
-                })
-            
-            estimated_gas = self.web3.eth.estimate_gas(tx)
-            return int(estimated_gas * 1.2)  # 20% buffer
+            swap_fn, value = self._swap_function(
+                router_fns, path, amount_in, amount_out_min,
+                recipient, deadline, is_native_in, is_native_out
+            )
             
+            # Build tx for estimation
+            params = {
+                'from': recipient,
+                'gas': 300000,
+                'maxFeePerGas': self.get_proper_gas_price(),
+                'maxPriorityFeePerGas': PRIORITY_FEE_WEI
+            }
+            if value:
+                params['value'] = value
+            tx = swap_fn.build_transaction(params)
         except Exception as e:
-            print(f"   ⚠️ Gas estimation failed: {e}")
+            log.warning("Gas estimation failed: %s", e)
             return 250000 if is_native_in else 300000
+        
+        return self._estimate_gas(tx, is_native_in)
     
     def build_swap_transaction(
         self,
@@ -231,19 +442,20 @@ class DEXRouter:
     ) -> Dict:
         """
         🔧 FIXED: Build swap transaction with proper native handling
+        The transaction is encoded once - gas is estimated on that same dict
         """
         try:
-            router = self.get_router_contract(dex)
+            # Checksummed once, reused for nonce, 'from' and the swap arguments
+            recipient = _cs(recipient)
+            router_fns = self.get_router_functions(dex)
             
             # 🔧 FIX: Determine if output is native
-            wrapped_token = self.network_config.get('wrapped_token')
             is_native_out = token_out in ['native', 'PLS', 'ETH']
             
             # Build path using wrapped addresses (for router)
             path = self.build_swap_path(token_in, token_out)
             
-            print(f"   📍 Swap path: {path}")
-            print(f"   🔹 Native IN: {is_native_in}, Native OUT: {is_native_out}")
+            log.debug("Swap path: %s (native in: %s, native out: %s)", path, is_native_in, is_native_out)
             
             if deadline is None:
                 deadline = int(time.time()) + 1200  # 20 min
@@ -252,65 +464,28 @@ class DEXRouter:
                 gas_price = self.get_proper_gas_price()
             
             if nonce is None:
-                nonce = self.web3.eth.get_transaction_count(
-                    Web3.to_checksum_address(recipient)
-                )
+                nonce = self.web3.eth.get_transaction_count(recipient)
             
-            if gas_limit is None:
-                gas_limit = self.estimate_gas_for_swap(
-                    dex, token_in, token_out, amount_in, 
-                    amount_out_min, recipient, deadline, is_native_in, is_native_out
-                )
+            swap_fn, value = self._swap_function(
+                router_fns, path, amount_in, amount_out_min,
+                recipient, deadline, is_native_in, is_native_out
+            )
             
-            priority_fee = self.web3.to_wei(2, 'gwei')
+            params = {
+                'from': recipient,
+                'gas': gas_limit or 300000,  # placeholder until estimated below
+                'maxFeePerGas': gas_price,
+                'maxPriorityFeePerGas': PRIORITY_FEE_WEI,
+                'nonce': nonce,
+                'chainId': self.network_config.get('chain_id', 369)
+            }
+            if value:
+                params['value'] = value
+            tx = swap_fn.build_transaction(params)
             
-            # 🔧 FIX: Choose correct router function based on native status
-            if is_native_in:
-                # Native PLS → Token (use swapExactETHForTokens)
-                print(f"   ✓ Using swapExactETHForTokens")
-                tx = router.functions.swapExactETHForTokens(
-                    amount_out_min, path,
-                    Web3.to_checksum_address(recipient),
-                    deadline
-                ).build_transaction({
-                    'from': Web3.to_checksum_address(recipient),
-                    'value': amount_in,
-                    'gas': gas_limit,
-                    'maxFeePerGas': gas_price,
-                    'maxPriorityFeePerGas': priority_fee,
-                    'nonce': nonce,
-                    'chainId': self.network_config.get('chain_id', 369)
-                })
-            elif is_native_out:
-                # Token → Native PLS (use swapExactTokensForETH)
-                print(f"   ✓ Using swapExactTokensForETH")
-                tx = router.functions.swapExactTokensForETH(
-                    amount_in, amount_out_min, path,
-                    Web3.to_checksum_address(recipient),
-                    deadline
-                ).build_transaction({
-                    'from': Web3.to_checksum_address(recipient),
-                    'gas': gas_limit,
-                    'maxFeePerGas': gas_price,
-                    'maxPriorityFeePerGas': priority_fee,
-                    'nonce': nonce,
-                    'chainId': self.network_config.get('chain_id', 369)
-                })
-            else:
-                # Token → Token (use swapExactTokensForTokens)
-                print(f"   ✓ Using swapExactTokensForTokens")
-                tx = router.functions.swapExactTokensForTokens(
-                    amount_in, amount_out_min, path,
-                    Web3.to_checksum_address(recipient),
-                    deadline
-                ).build_transaction({
-                    'from': Web3.to_checksum_address(recipient),
-                    'gas': gas_limit,
-                    'maxFeePerGas': gas_price,
-                    'maxPriorityFeePerGas': priority_fee,
-                    'nonce': nonce,
-                    'chainId': self.network_config.get('chain_id', 369)
-                })
+            if gas_limit is None:
+                gas_limit = self._estimate_gas(tx, is_native_in)
+                tx['gas'] = gas_limit
             
             return {
                 'success': True,
@@ -321,9 +496,8 @@ class DEXRouter:
             }
             
         except Exception as e:
-            print(f"   ❌ Transaction build error: {e}")
-            import traceback
-            traceback.print_exc()
+            # Full traceback only when debugging
+            log.error("Transaction build error: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
             return {
                 'success': False,
                 'error': str(e),
@@ -331,10 +505,12 @@ class DEXRouter:
             }
     
     def get_best_dex_for_swap(
-        self, token_in: str, token_out: str, amount_in: int
-    ) -> Tuple[str, int]:
+        self, token_in: str, token_out: str, amount_in: int, exclude: Optional[set] = None
+    ) -> Tuple[Optional[str], int]:
         """
         🔧 FIXED: Find best DEX and return default if none found
+        exclude: DEX names to skip (e.g. one that just failed on a retry)
+        Returns (None, 0) if exclude leaves no DEX to use
         """
         best_dex = None
         best_amount_out = 0
@@ -342,55 +518,70 @@ class DEXRouter:
         # Build path for querying
         path = self.build_swap_path(token_in, token_out)
         
-        for dex_name in self.network_config.get('dexs', {}).keys():
-            try:
-                amounts = self.get_amounts_out(dex_name, amount_in, path)
-                if amounts and amounts[-1] > best_amount_out:
-                    best_amount_out = amounts[-1]
-                    best_dex = dex_name
-            except Exception as e:
-                print(f"   ⚠️ {dex_name} query failed: {e}")
-                continue
+        dex_names = [
+            dex_name for dex_name in self.network_config.get('dexs', {})
+            if not exclude or dex_name not in exclude
+        ]
+        
+        # Everything excluded: nothing left to route through
+        if exclude and not dex_names:
+            log.warning("All DEXes excluded, no route for swap")
+            return None, 0
+        
+        # Only one candidate: it wins by default, just quote it
+        if len(dex_names) == 1:
+            amounts = self.get_amounts_out(dex_names[0], amount_in, path)
+            return dex_names[0], amounts[-1] if amounts else 0
+        
+        # One batched RPC for every DEX (each quote would otherwise be a round-trip)
+        all_amounts = self.get_amounts_out_batch([(dex_name, amount_in, path) for dex_name in dex_names])
+        quotes = zip(dex_names, all_amounts)
+        
+        # Same order as the config, so ties still go to the first DEX
+        for dex_name, amounts in quotes:
+            if amounts and amounts[-1] > best_amount_out:
+                best_amount_out = amounts[-1]
+                best_dex = dex_name
         
         # 🔧 FIX: Return default DEX if none found
         if best_dex is None:
             best_dex = self.get_default_dex()
-            print(f"   ⚠️ No DEX found best price, using default: {best_dex}")
+            if exclude and best_dex in exclude:
+                best_dex = dex_names[0]
+            log.warning("No DEX found best price, using default: %s", best_dex)
         
         return best_dex, best_amount_out
     
     def check_liquidity(self, dex: str, token_a: str, token_b: str) -> Dict:
         """Check liquidity"""
         try:
-            dex_config = self.network_config.get('dexs', {}).get(dex, {})
-            factory_address = dex_config.get('factory')
-            
-            if not factory_address:
-                return {'has_liquidity': False, 'error': 'Factory not configured'}
+            pair_key = (dex, token_a.lower(), token_b.lower())
+            pair_address = self._pair_addresses.get(pair_key)
             
-            factory_abi = self.abi_manager.get_abi('uniswap_v2_factory')
-            factory = self.web3.eth.contract(
-                address=Web3.to_checksum_address(factory_address),
-                abi=factory_abi
-            )
-            
-            pair_address = factory.functions.getPair(
-                Web3.to_checksum_address(token_a),
-                Web3.to_checksum_address(token_b)
-            ).call()
+            if pair_address is None:
+                factory = self.get_factory_contract(dex)
+                if factory is None:
+                    return {'has_liquidity': False, 'error': 'Factory not configured'}
+                
+                pair_address = factory.functions.getPair(
+                    _cs(token_a),
+                    _cs(token_b)
+                ).call()
+                
+                # Only existing pairs are cached (a missing pair may be created later)
+                if pair_address == '0x0000000000000000000000000000000000000000':
+                    return {'has_liquidity': False, 'pair': None}
+                self._pair_addresses[pair_key] = pair_address
             
-            if pair_address == '0x0000000000000000000000000000000000000000':
-                return {'has_liquidity': False, 'pair': None}
+            pair = self.get_pair_contract(pair_address)
             
-            pair_abi = self.abi_manager.get_abi('uniswap_v2_pair')
-            pair = self.web3.eth.contract(
-                address=Web3.to_checksum_address(pair_address),
-                abi=pair_abi
-            )
-            
-            reserves = pair.functions.getReserves().call()
-            token0 = pair.functions.token0().call()
-            token1 = pair.functions.token1().call()
+            tokens = self._pair_tokens.get(pair_address)
+            if tokens is None:
+                reserves, token0, token1 = self._read_pair(pair)
+                self._pair_tokens[pair_address] = (token0, token1)
+            else:
+                reserves = pair.functions.getReserves().call()
+                token0, token1 = tokens
             
             return {
                 'has_liquidity': True,
@@ -404,6 +595,22 @@ class DEXRouter:
         except Exception as e:
             return {'has_liquidity': False, 'error': str(e)}
     
+    def _read_pair(self, pair) -> Tuple:
+        """getReserves + token0 + token1 in one JSON-RPC batch (one by one if the provider can't batch)"""
+        try:
+            reserves, token0, token1 = _batch_call(self.web3, [
+                pair.functions.getReserves(),
+                pair.functions.token0(),
+                pair.functions.token1()
+            ])
+            return reserves, token0, token1
+        except Exception:
+            return (
+                pair.functions.getReserves().call(),
+                pair.functions.token0().call(),
+                pair.functions.token1().call()
+            )
+    
     def get_default_dex(self) -> str:
         """Get default DEX"""
         dexs = self.network_config.get('dexs', {})
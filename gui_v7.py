@@ -15,9 +15,15 @@ if src_path.exists() and str(src_path) not in sys.path:
 
 import customtkinter as ctk
 from customtkinter import CTkFont
-import threading
+import hashlib
+import logging
+import queue
 import time
+from collections import deque
 from datetime import datetime
+from functools import partial, wraps
+import tkinter as tk
+from tkinter import TclError, ttk
 
 try:
     from main_v7 import TradingBotV7
@@ -25,6 +31,62 @@ except ImportError:
     print("❌ main_v7.py not found!")
     TradingBotV7 = None
 
+logger = logging.getLogger(__name__)
+
+# Activity feed keeps at most this many lines, trimmed in batches of ACTIVITY_TRIM_SLACK
+ACTIVITY_MAX_LINES = 500
+ACTIVITY_TRIM_SLACK = 50
+
+# Event drain interval: snaps to the minimum while events flow, doubles per idle tick up to the maximum
+TICK_MIN_MS = 50
+TICK_MAX_MS = 1000
+
+# Activity feed colours per level ('info' uses the default text colour)
+ACTIVITY_LEVEL_COLORS = {
+    'success': "green",
+    'error': "red",
+    'warning': "orange",
+    'trade': "#4da6ff",
+    'opportunity': "#4da6ff",
+}
+
+# Wallet display text, built once
+_BAR_EQ = "=" * 80 + "\n"
+_BAR_DASH = "-" * 80 + "\n"
+_WALLET_TMPL = (
+    _BAR_EQ + "  WALLET INFO\n" + _BAR_EQ + "\n"
+    "Connected: {connected}\n"
+    "Address: {address}\n"
+    "Network: {network}\n\n"
+    + _BAR_DASH + "  NATIVE TOKEN\n" + _BAR_DASH +
+    "{native_symbol}: {native_balance:.6f}\n"
+    "Price: ${native_price:.6f}\n"
+    "Value: ${native_value:.2f}\n\n"
+)
+_TOKENS_HEADER_TMPL = _BAR_DASH + "  ERC20 TOKENS ({count} found)\n" + _BAR_DASH + "\n"
+_WALLET_FOOTER_TMPL = "\n" + _BAR_EQ + "  TOTAL VALUE: ${total:.2f}\n" + _BAR_EQ
+
+# Position rows (%-formatting measured faster than both f-strings and str.format here)
+_OPEN_POS_FMT = "ID: %s | Token: %s... | Amount: %.4f | P&L: $%.2f (%.2f%%)\n"
+_CLOSED_POS_FMT = "ID: %s | Token: %s... | P&L: $%.2f (%.2f%%) | Reason: %s"
+
+def debounced(ms: int):
+    """Coalesce a burst of calls to a GUI handler into one call after `ms` of quiet"""
+    def wrap(fn):
+        @wraps(fn)
+        def wrapper(self, *args):
+            pending = self._pending_after.pop(fn.__name__, None)
+            if pending is not None:
+                self.after_cancel(pending)
+            
+            def fire():
+                self._pending_after.pop(fn.__name__, None)
+                fn(self, *args)
+            
+            self._pending_after[fn.__name__] = self.after(ms, fire)
+        return wrapper
+    return wrap
+
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
@@ -37,6 +99,26 @@ class TradingBotGUI(ctk.CTk):
         self.title("DEX Trading Bot v7.0 - Professional Edition")
         self.geometry("1600x1000")
         
+        # Shared fonts, created once instead of per widget
+        self.F_TITLE = CTkFont(size=26, weight="bold")
+        self.F_BIG = CTkFont(size=22, weight="bold")
+        self.F_PAGE = CTkFont(size=20, weight="bold")
+        self.F_H1 = CTkFont(size=18, weight="bold")
+        self.F_H2 = CTkFont(size=16, weight="bold")
+        self.F_BUTTON = CTkFont(size=14, weight="bold")
+        self.F_LARGE = CTkFont(size=18)
+        self.F_MEDIUM = CTkFont(size=16)
+        self.F_BODY = CTkFont(size=14)
+        self.F_SMALL = CTkFont(size=13)
+        
+        # ttk styles for the labels refreshed every tick (native text draw, no CTk canvas redraw)
+        text_color = self._apply_appearance_mode(ctk.ThemeManager.theme["CTkLabel"]["text_color"])
+        style = ttk.Style(self)
+        style.configure('Status.TLabel', font=self.F_H1)
+        style.configure('Big.TLabel', font=self.F_BIG, foreground=text_color)
+        style.configure('Stat.TLabel', font=self.F_LARGE, foreground=text_color)
+        style.configure('StatSmall.TLabel', font=self.F_MEDIUM, foreground=text_color)
+        
         # Initialize bot
         if TradingBotV7:
             self.bot = TradingBotV7(network='pulsechain')
@@ -44,15 +126,27 @@ class TradingBotGUI(ctk.CTk):
             self.bot = None
         
         # GUI state
-        self.update_thread = None
-        self.running_updates = False
+        self._last_version = -1
+        self._wallet_text_hash = None
+        self._open_pos_cache = None     # pos_id -> rendered line, in display order
+        self._line_cache = {}           # pos_id -> ((amount, pnl, pnl_percent), line)
+        self._closed_pos_seen = None    # len(bot.closed_positions) at last render
+        self._closed_pos_lines = 0      # closed rows currently shown
+        self._last_balance = None
+        self._label_texts = {}          # label -> last text set, avoids a cget() Tcl round-trip
+        self._activity_pending = deque(maxlen=ACTIVITY_MAX_LINES)
+        self._activity_lines = 0
+        self._tick_id = None
+        self._tick_interval = TICK_MIN_MS
+        self._pending_after = {}
+        self._refresh_pending = False
+        self._event_handlers = {
+            'status': self._on_status,
+        }
         
         # Build GUI
         self.build_gui()
         
-        # FIXED: Load current settings into GUI
-        self.load_current_settings()
-        
         # Start update loop
         self.start_gui_updates()
     
@@ -66,7 +160,7 @@ class TradingBotGUI(ctk.CTk):
         self.build_top_bar()
         
         # === TAB VIEW ===
-        self.tabview = ctk.CTkTabview(self, width=1560, height=900)
+        self.tabview = ctk.CTkTabview(self, width=1560, height=900, command=self._on_tab_changed)
         self.tabview.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="nsew")
         
         # Add tabs
@@ -76,12 +170,27 @@ class TradingBotGUI(ctk.CTk):
         self.tabview.add("Positions")
         self.tabview.add("Settings")
         
-        # Build tabs
+        # Dashboard is the default tab; the rest are built on first selection
         self.build_dashboard_tab()
-        self.build_wallet_tab()
-        self.build_strategies_tab()
-        self.build_positions_tab()
-        self.build_settings_tab()
+        self._tab_builders = {
+            "Wallet": self.build_wallet_tab,
+            "Strategies": self.build_strategies_tab,
+            "Positions": self.build_positions_tab,
+            "Settings": self.build_settings_tab,
+        }
+    
+    def _on_tab_changed(self):
+        """Build a tab the first time it is selected and bring it up to date"""
+        name = self.tabview.get()
+        builder = self._tab_builders.pop(name, None)
+        if builder is not None:
+            builder()
+            if name == "Settings":
+                self.load_current_settings()
+        
+        # Panes on hidden tabs are skipped by refreshes; catch the visible one up now
+        self._last_version = -1
+        self._request_refresh()
     
     def build_top_bar(self):
         """Build top control bar"""
@@ -93,16 +202,16 @@ class TradingBotGUI(ctk.CTk):
         title_label = ctk.CTkLabel(
             top_frame,
             text="🚀 DEX TRADING BOT v7.0",
-            font=ctk.CTkFont(size=26, weight="bold")
+            font=self.F_TITLE
         )
         title_label.grid(row=0, column=0, padx=20, pady=10, sticky="w")
         
         # Status indicator
-        self.status_label = ctk.CTkLabel(
+        self.status_label = self._ttk_label(
             top_frame,
             text="● STOPPED",
-            text_color="red",
-            font=ctk.CTkFont(size=18, weight="bold")
+            style='Status.TLabel',
+            foreground="red"
         )
         self.status_label.grid(row=0, column=1, padx=10)
         
@@ -115,7 +224,7 @@ class TradingBotGUI(ctk.CTk):
             hover_color="darkgreen",
             width=160,
             height=45,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.F_BUTTON
         )
         self.start_button.grid(row=0, column=2, padx=10)
         
@@ -128,7 +237,7 @@ class TradingBotGUI(ctk.CTk):
             hover_color="darkred",
             width=160,
             height=45,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.F_BUTTON
         )
         self.emergency_button.grid(row=0, column=3, padx=10)
         
@@ -138,11 +247,16 @@ class TradingBotGUI(ctk.CTk):
             values=["pulsechain", "ethereum", "bsc", "polygon"],
             command=self.change_network,
             width=150,
-            font=ctk.CTkFont(size=13)
+            font=self.F_SMALL
         )
         self.network_selector.set("pulsechain")
         self.network_selector.grid(row=0, column=4, padx=10)
     
+    def _ttk_label(self, parent, text: str, style: str, **kwargs):
+        """ttk label blended into a CTk frame, for text that changes every tick"""
+        background = parent._apply_appearance_mode(parent.cget("fg_color"))
+        return ttk.Label(parent, text=text, style=style, background=background, **kwargs)
+    
     def build_dashboard_tab(self):
         """Enhanced dashboard with integrated activity feed"""
         tab = self.tabview.tab("Dashboard")
@@ -163,35 +277,35 @@ class TradingBotGUI(ctk.CTk):
         stats_title = ctk.CTkLabel(
             stats_frame,
             text="📊 Performance Metrics",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.F_H1
         )
         stats_title.pack(pady=10)
         
-        self.balance_label = ctk.CTkLabel(
+        self.balance_label = self._ttk_label(
             stats_frame,
             text="Balance: $0.00",
-            font=ctk.CTkFont(size=22, weight="bold")
+            style='Big.TLabel'
         )
         self.balance_label.pack(pady=5)
         
-        self.profit_label = ctk.CTkLabel(
+        self.profit_label = self._ttk_label(
             stats_frame,
             text="Total P&L: $0.00",
-            font=ctk.CTkFont(size=18)
+            style='Stat.TLabel'
         )
         self.profit_label.pack(pady=5)
         
-        self.trades_label = ctk.CTkLabel(
+        self.trades_label = self._ttk_label(
             stats_frame,
             text="Trades: 0 (0W / 0L)",
-            font=ctk.CTkFont(size=16)
+            style='StatSmall.TLabel'
         )
         self.trades_label.pack(pady=5)
         
-        self.winrate_label = ctk.CTkLabel(
+        self.winrate_label = self._ttk_label(
             stats_frame,
             text="Win Rate: 0%",
-            font=ctk.CTkFont(size=16)
+            style='StatSmall.TLabel'
         )
         self.winrate_label.pack(pady=5)
         
@@ -202,7 +316,7 @@ class TradingBotGUI(ctk.CTk):
         controls_title = ctk.CTkLabel(
             controls_frame,
             text="⚙️ Trading Controls",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         )
         controls_title.pack(pady=10)
         
@@ -229,7 +343,8 @@ class TradingBotGUI(ctk.CTk):
         balance_label = ctk.CTkLabel(balance_frame, text="Trading Balance:")
         balance_label.pack(side="left", padx=10)
         
-        self.balance_entry = ctk.CTkEntry(balance_frame, placeholder_text="10000", width=120)
+        self.balance_var = ctk.DoubleVar(value=self.bot.trading_balance if self.bot else 10000)
+        self.balance_entry = ctk.CTkEntry(balance_frame, textvariable=self.balance_var, width=120)
         self.balance_entry.pack(side="left", padx=5)
         
         apply_button = ctk.CTkButton(
@@ -247,13 +362,15 @@ class TradingBotGUI(ctk.CTk):
         activity_title = ctk.CTkLabel(
             right_column,
             text="📡 Live Activity Feed",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.F_H1
         )
         activity_title.pack(pady=10)
         
         # Activity feed
         self.activity_text = ctk.CTkTextbox(right_column, width=700, height=700)
         self.activity_text.pack(padx=10, pady=10, fill="both", expand=True)
+        for level, color in ACTIVITY_LEVEL_COLORS.items():
+            self.activity_text.tag_config(level, foreground=color)
         
         # Clear button
         clear_button = ctk.CTkButton(
@@ -271,7 +388,7 @@ class TradingBotGUI(ctk.CTk):
         self.wallet_status_label = ctk.CTkLabel(
             tab,
             text="Wallet: Not Connected",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self.F_H1,
             text_color="orange"
         )
         self.wallet_status_label.pack(pady=20)
@@ -283,7 +400,7 @@ class TradingBotGUI(ctk.CTk):
         conn_title = ctk.CTkLabel(
             conn_frame,
             text="🔑 Connect Wallet",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         )
         conn_title.pack(pady=10)
         
@@ -340,7 +457,7 @@ class TradingBotGUI(ctk.CTk):
         balance_title = ctk.CTkLabel(
             balance_frame,
             text="💰 Token Balances",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         )
         balance_title.pack(pady=10)
         
@@ -363,7 +480,7 @@ class TradingBotGUI(ctk.CTk):
         info_label = ctk.CTkLabel(
             tab,
             text="🎯 Trading Strategies",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self.F_PAGE
         )
         info_label.pack(pady=20)
         
@@ -388,8 +505,8 @@ class TradingBotGUI(ctk.CTk):
                 frame,
                 text=strategy.replace("_", " ").title(),
                 variable=var,
-                command=lambda s=strategy, v=var: self.toggle_strategy(s, v),
-                font=ctk.CTkFont(size=14)
+                command=partial(self.toggle_strategy, strategy, var),
+                font=self.F_BODY
             )
             checkbox.pack(side="left", padx=20, pady=10)
             
@@ -403,9 +520,10 @@ class TradingBotGUI(ctk.CTk):
         open_label = ctk.CTkLabel(
             tab,
             text="📈 Open Positions",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.F_H1
         )
         open_label.pack(pady=10)
+        self._open_positions_label = open_label
         
         self.open_positions_text = ctk.CTkTextbox(tab, width=1500, height=350)
         self.open_positions_text.pack(padx=20, pady=10)
@@ -414,12 +532,23 @@ class TradingBotGUI(ctk.CTk):
         closed_label = ctk.CTkLabel(
             tab,
             text="📊 Recent Closed Positions",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.F_H1
         )
         closed_label.pack(pady=10)
         
-        self.closed_positions_text = ctk.CTkTextbox(tab, width=1500, height=350)
-        self.closed_positions_text.pack(padx=20, pady=10)
+        # Plain Listbox: flat string list, one Tcl call per append/trim, styled like a CTkTextbox
+        textbox_theme = ctk.ThemeManager.theme["CTkTextbox"]
+        self.closed_positions_list = tk.Listbox(
+            tab,
+            height=10,
+            font=self.F_SMALL,
+            background=self._apply_appearance_mode(textbox_theme["fg_color"]),
+            foreground=self._apply_appearance_mode(textbox_theme["text_color"]),
+            activestyle="none",
+            borderwidth=0,
+            highlightthickness=0
+        )
+        self.closed_positions_list.pack(fill="x", padx=20, pady=10)
     
     def build_settings_tab(self):
         """FIXED: Enhanced settings tab with proper bot integration"""
@@ -435,7 +564,7 @@ class TradingBotGUI(ctk.CTk):
         risk_label = ctk.CTkLabel(
             left_frame,
             text="⚠️ Risk Management",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.F_H1
         )
         risk_label.pack(pady=15)
         
@@ -445,7 +574,8 @@ class TradingBotGUI(ctk.CTk):
         
         pos_size_label = ctk.CTkLabel(pos_size_frame, text="Max Position Size (%)")
         pos_size_label.pack(pady=5)
-        self.pos_size_entry = ctk.CTkEntry(pos_size_frame, placeholder_text="5")
+        self.pos_size_var = ctk.DoubleVar(value=5)
+        self.pos_size_entry = ctk.CTkEntry(pos_size_frame, textvariable=self.pos_size_var)
         self.pos_size_entry.pack(pady=5)
         
         # Stop loss
@@ -454,7 +584,8 @@ class TradingBotGUI(ctk.CTk):
         
         sl_label = ctk.CTkLabel(sl_frame, text="Stop Loss (%)")
         sl_label.pack(pady=5)
-        self.sl_entry = ctk.CTkEntry(sl_frame, placeholder_text="5")
+        self.sl_var = ctk.DoubleVar(value=5)
+        self.sl_entry = ctk.CTkEntry(sl_frame, textvariable=self.sl_var)
         self.sl_entry.pack(pady=5)
         
         # Take profit
@@ -463,7 +594,8 @@ class TradingBotGUI(ctk.CTk):
         
         tp_label = ctk.CTkLabel(tp_frame, text="Take Profit (%)")
         tp_label.pack(pady=5)
-        self.tp_entry = ctk.CTkEntry(tp_frame, placeholder_text="10")
+        self.tp_var = ctk.DoubleVar(value=10)
+        self.tp_entry = ctk.CTkEntry(tp_frame, textvariable=self.tp_var)
         self.tp_entry.pack(pady=5)
         
         # Daily loss limit
@@ -472,7 +604,8 @@ class TradingBotGUI(ctk.CTk):
         
         daily_loss_label = ctk.CTkLabel(daily_loss_frame, text="Max Daily Loss (%)")
         daily_loss_label.pack(pady=5)
-        self.daily_loss_entry = ctk.CTkEntry(daily_loss_frame, placeholder_text="10")
+        self.daily_loss_var = ctk.DoubleVar(value=10)
+        self.daily_loss_entry = ctk.CTkEntry(daily_loss_frame, textvariable=self.daily_loss_var)
         self.daily_loss_entry.pack(pady=5)
         
         # Apply risk button
@@ -493,7 +626,7 @@ class TradingBotGUI(ctk.CTk):
         trading_label = ctk.CTkLabel(
             right_frame,
             text="🔧 Trading Settings",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.F_H1
         )
         trading_label.pack(pady=15)
         
@@ -503,7 +636,8 @@ class TradingBotGUI(ctk.CTk):
         
         slippage_label = ctk.CTkLabel(slippage_frame, text="Slippage Tolerance (%)")
         slippage_label.pack(pady=5)
-        self.slippage_entry = ctk.CTkEntry(slippage_frame, placeholder_text="0.5")
+        self.slippage_var = ctk.DoubleVar(value=0.5)
+        self.slippage_entry = ctk.CTkEntry(slippage_frame, textvariable=self.slippage_var)
         self.slippage_entry.pack(pady=5)
         
         # Gas multiplier
@@ -512,7 +646,8 @@ class TradingBotGUI(ctk.CTk):
         
         gas_label = ctk.CTkLabel(gas_frame, text="Gas Price Multiplier")
         gas_label.pack(pady=5)
-        self.gas_entry = ctk.CTkEntry(gas_frame, placeholder_text="1.2")
+        self.gas_var = ctk.DoubleVar(value=1.2)
+        self.gas_entry = ctk.CTkEntry(gas_frame, textvariable=self.gas_var)
         self.gas_entry.pack(pady=5)
         
         # Min trade size
@@ -521,7 +656,8 @@ class TradingBotGUI(ctk.CTk):
         
         min_trade_label = ctk.CTkLabel(min_trade_frame, text="Min Trade Size (USD)")
         min_trade_label.pack(pady=5)
-        self.min_trade_entry = ctk.CTkEntry(min_trade_frame, placeholder_text="1.0")
+        self.min_trade_var = ctk.DoubleVar(value=1.0)
+        self.min_trade_entry = ctk.CTkEntry(min_trade_frame, textvariable=self.min_trade_var)
         self.min_trade_entry.pack(pady=5)
         
         # Apply trading button
@@ -543,19 +679,22 @@ class TradingBotGUI(ctk.CTk):
             return
         
         try:
-            # Load risk settings
-            self.pos_size_entry.insert(0, str(self.bot.max_position_size_percent * 100))
-            self.sl_entry.insert(0, str(self.bot.stop_loss_percent * 100))
-            self.tp_entry.insert(0, str(self.bot.take_profit_percent * 100))
-            self.daily_loss_entry.insert(0, str(self.bot.max_daily_loss_percent * 100))
-            
-            # Load trading settings
-            self.slippage_entry.insert(0, str(self.bot.slippage_tolerance_percent))
-            self.gas_entry.insert(0, str(self.bot.gas_price_multiplier))
-            self.min_trade_entry.insert(0, str(self.bot.min_trade_size_usd))
+            bot = self.bot
+            pairs = [
+                # Risk settings
+                (self.pos_size_var, f"{bot.max_position_size_percent * 100:.4g}"),
+                (self.sl_var, f"{bot.stop_loss_percent * 100:.4g}"),
+                (self.tp_var, f"{bot.take_profit_percent * 100:.4g}"),
+                (self.daily_loss_var, f"{bot.max_daily_loss_percent * 100:.4g}"),
+                
+                # Trading settings
+                (self.slippage_var, f"{bot.slippage_tolerance * 100:.4g}"),
+                (self.gas_var, f"{bot.gas_price_multiplier:.4g}"),
+                (self.min_trade_var, f"{bot.min_trade_size_usd:g}"),
+            ]
             
-            # Load balance
-            self.balance_entry.insert(0, str(self.bot.trading_balance))
+            # One idle callback so Tk lays the entries out once
+            self.after_idle(lambda: [var.set(text) for var, text in pairs])
             
         except Exception as e:
             print(f"⚠️ Error loading settings: {e}")
@@ -571,28 +710,43 @@ class TradingBotGUI(ctk.CTk):
         if not self.bot.running:
             result = self.bot.start_bot()
             if result['success']:
-                self.start_button.configure(text="⏸️ STOP BOT", fg_color="orange")
-                self.status_label.configure(text="● RUNNING", text_color="green")
+                self._batch_configure([
+                    (self.start_button, {'text': "⏸️ STOP BOT", 'fg_color': "orange"}),
+                    (self.status_label, {'text': "● RUNNING", 'foreground': "green"}),
+                ])
             else:
                 self.log_activity(f"❌ Failed to start: {result.get('error')}", 'error')
         else:
             result = self.bot.stop_bot()
             if result['success']:
-                self.start_button.configure(text="🚀 START BOT", fg_color="green")
-                self.status_label.configure(text="● STOPPED", text_color="red")
+                self._show_stopped()
     
     def emergency_stop(self):
         """Emergency stop"""
         if self.bot:
             result = self.bot.emergency_stop()
             if result['success']:
-                self.status_label.configure(text="● STOPPED", text_color="red")
-                self.start_button.configure(text="🚀 START BOT", fg_color="green")
+                self._show_stopped()
+    
+    def _show_stopped(self):
+        """Flip the top bar back to the stopped state"""
+        self._batch_configure([
+            (self.start_button, {'text': "🚀 START BOT", 'fg_color': "green"}),
+            (self.status_label, {'text': "● STOPPED", 'foreground': "red"}),
+        ])
     
+    def _batch_configure(self, updates):
+        """Configure several widgets, then run a single idle/layout pass"""
+        for widget, options in updates:
+            widget.configure(**options)
+        self.update_idletasks()
+    
+    @debounced(300)
     def change_network(self, network: str):
         """Change network"""
         self.log_activity(f"🌐 Network changed to: {network}", 'info')
     
+    @debounced(300)
     def change_mode(self, mode: str):
         """Change trading mode"""
         if self.bot:
@@ -602,20 +756,34 @@ class TradingBotGUI(ctk.CTk):
                 # Revert selector
                 self.mode_selector.set(self.bot.mode)
     
+    def _get_float(self, var):
+        """Read a DoubleVar-bound entry: None if left empty, ValueError if not a number"""
+        try:
+            return var.get()
+        except TclError:
+            raw = str(self.getvar(str(var))).strip()
+            if raw:
+                raise ValueError(f"Not a number: {raw}")
+            return None
+    
+    @debounced(300)
     def apply_balance(self):
         """FIXED: Apply trading balance with validation"""
         try:
-            balance = float(self.balance_entry.get())
+            balance = self._get_float(self.balance_var)
+            if balance is None:
+                raise ValueError("empty balance")
             if self.bot:
                 result = self.bot.set_balance(balance)
                 if result['success']:
                     self.log_activity(f"💰 Trading balance set to: ${balance:.2f}", 'success')
-                    self.update_balance_display()
+                    self._request_refresh()
                 else:
                     self.log_activity(f"❌ Balance update failed: {result.get('error')}", 'error')
         except ValueError:
             self.log_activity("❌ Invalid balance amount", 'error')
     
+    @debounced(300)
     def apply_risk_settings(self):
         """FIXED: Apply risk management settings to bot"""
         try:
@@ -625,17 +793,15 @@ class TradingBotGUI(ctk.CTk):
             
             settings = {}
             
-            if self.pos_size_entry.get():
-                settings['max_position_size_percent'] = float(self.pos_size_entry.get()) / 100
-            
-            if self.sl_entry.get():
-                settings['stop_loss_percent'] = float(self.sl_entry.get()) / 100
-            
-            if self.tp_entry.get():
-                settings['take_profit_percent'] = float(self.tp_entry.get()) / 100
-            
-            if self.daily_loss_entry.get():
-                settings['max_daily_loss_percent'] = float(self.daily_loss_entry.get()) / 100
+            for key, var in (
+                ('max_position_size_percent', self.pos_size_var),
+                ('stop_loss_percent', self.sl_var),
+                ('take_profit_percent', self.tp_var),
+                ('max_daily_loss_percent', self.daily_loss_var),
+            ):
+                value = self._get_float(var)
+                if value is not None:
+                    settings[key] = value / 100
             
             result = self.bot.set_risk_settings(settings)
             
@@ -647,6 +813,7 @@ class TradingBotGUI(ctk.CTk):
         except ValueError:
             self.log_activity("❌ Invalid risk settings values", 'error')
     
+    @debounced(300)
     def apply_trading_settings(self):
         """FIXED: Apply trading settings to bot"""
         try:
@@ -656,14 +823,14 @@ class TradingBotGUI(ctk.CTk):
             
             settings = {}
             
-            if self.slippage_entry.get():
-                settings['slippage_tolerance_percent'] = float(self.slippage_entry.get())
-            
-            if self.gas_entry.get():
-                settings['gas_price_multiplier'] = float(self.gas_entry.get())
-            
-            if self.min_trade_entry.get():
-                settings['min_trade_size_usd'] = float(self.min_trade_entry.get())
+            for key, var in (
+                ('slippage_tolerance_percent', self.slippage_var),
+                ('gas_price_multiplier', self.gas_var),
+                ('min_trade_size_usd', self.min_trade_var),
+            ):
+                value = self._get_float(var)
+                if value is not None:
+                    settings[key] = value
             
             result = self.bot.set_trading_settings(settings)
             
@@ -678,10 +845,13 @@ class TradingBotGUI(ctk.CTk):
     def connect_private_key(self):
         """Connect wallet with private key"""
         pk = self.pk_entry.get()
+        # Don't leave the key sitting in the entry widget
+        self.pk_entry.delete(0, "end")
         if self.bot and self.bot.backend and self.bot.backend.wallet_manager:
             result = self.bot.backend.wallet_manager.connect_with_private_key(
                 pk, self.bot.web3, self.bot.network
             )
+            del pk
             if result['success']:
                 self.wallet_status_label.configure(
                     text=f"✅ Connected: {result['address'][:10]}...",
@@ -695,10 +865,13 @@ class TradingBotGUI(ctk.CTk):
     def connect_seed_phrase(self):
         """Connect wallet with seed phrase"""
         seed = self.seed_entry.get()
+        # Don't leave the phrase sitting in the entry widget
+        self.seed_entry.delete(0, "end")
         if self.bot and self.bot.backend and self.bot.backend.wallet_manager:
             result = self.bot.backend.wallet_manager.connect_with_seed_phrase(
                 seed, self.bot.web3, self.bot.network
             )
+            del seed
             if result['success']:
                 self.wallet_status_label.configure(
                     text=f"✅ Connected: {result['address'][:10]}...",
@@ -719,52 +892,45 @@ class TradingBotGUI(ctk.CTk):
         if self.bot and self.bot.backend and self.bot.backend.wallet_manager:
             info = self.bot.backend.wallet_manager.get_wallet_info()
             
-            self.wallet_info_text.delete("1.0", "end")
-            
-            # Header
-            self.wallet_info_text.insert("1.0", "="*80 + "\n")
-            self.wallet_info_text.insert("end", f"  WALLET INFO\n")
-            self.wallet_info_text.insert("end", "="*80 + "\n\n")
-            
-            # Connection status
-            self.wallet_info_text.insert("end", f"Connected: {info.get('connected')}\n")
-            self.wallet_info_text.insert("end", f"Address: {info.get('address', 'N/A')}\n")
-            self.wallet_info_text.insert("end", f"Network: {info.get('network', 'N/A')}\n\n")
-            
-            # Native balance
-            self.wallet_info_text.insert("end", "-"*80 + "\n")
-            self.wallet_info_text.insert("end", "  NATIVE TOKEN\n")
-            self.wallet_info_text.insert("end", "-"*80 + "\n")
-            
-            native_symbol = info.get('native_symbol', 'N/A')
             native_balance = info.get('native_balance', 0)
             native_price = info.get('native_price_usd', 0)
-            native_value = native_balance * native_price
             
-            self.wallet_info_text.insert("end", f"{native_symbol}: {native_balance:.6f}\n")
-            self.wallet_info_text.insert("end", f"Price: ${native_price:.6f}\n")
-            self.wallet_info_text.insert("end", f"Value: ${native_value:.2f}\n\n")
+            # Header, connection status and native balance
+            parts = [_WALLET_TMPL.format(
+                connected=info.get('connected'),
+                address=info.get('address', 'N/A'),
+                network=info.get('network', 'N/A'),
+                native_symbol=info.get('native_symbol', 'N/A'),
+                native_balance=native_balance,
+                native_price=native_price,
+                native_value=native_balance * native_price
+            )]
             
             # ERC20 tokens
             tokens = info.get('tokens', [])
             if len(tokens) > 0:
-                self.wallet_info_text.insert("end", "-"*80 + "\n")
-                self.wallet_info_text.insert("end", f"  ERC20 TOKENS ({len(tokens)} found)\n")
-                self.wallet_info_text.insert("end", "-"*80 + "\n\n")
-                
-                for token in tokens:
-                    symbol = token.get('symbol', 'UNKNOWN')
-                    balance = token.get('balance', 0)
-                    value = token.get('value_usd', 0)
-                    
-                    self.wallet_info_text.insert("end", f"{symbol}: {balance:.6f} (${value:.2f})\n")
+                parts.append(_TOKENS_HEADER_TMPL.format(count=len(tokens)))
+                parts.append("".join(
+                    f"{token.get('symbol', 'UNKNOWN')}: {token.get('balance', 0):.6f} (${token.get('value_usd', 0):.2f})\n"
+                    for token in tokens
+                ))
             else:
-                self.wallet_info_text.insert("end", "\n📍 No ERC20 tokens detected with balance\n")
+                parts.append("\n📍 No ERC20 tokens detected with balance\n")
             
             # Total value
-            self.wallet_info_text.insert("end", "\n" + "="*80 + "\n")
-            self.wallet_info_text.insert("end", f"  TOTAL VALUE: ${info.get('total_value_usd', 0):.2f}\n")
-            self.wallet_info_text.insert("end", "="*80 + "\n")
+            parts.append(_WALLET_FOOTER_TMPL.format(total=info.get('total_value_usd', 0)))
+            
+            self._replace_text(self.wallet_info_text, "".join(parts), '_wallet_text_hash')
+    
+    def _replace_text(self, box, text: str, hash_attr: str):
+        """Rewrite a textbox in one insert, skipping it if the content is unchanged"""
+        digest = hashlib.blake2b(text.encode(), digest_size=8).digest()
+        if digest == getattr(self, hash_attr):
+            return
+        setattr(self, hash_attr, digest)
+        
+        box.delete("1.0", "end")
+        box.insert("1.0", text)
     
     def toggle_strategy(self, strategy: str, var):
         """Toggle strategy"""
@@ -777,123 +943,318 @@ class TradingBotGUI(ctk.CTk):
     def clear_activity(self):
         """Clear activity feed"""
         self.activity_text.delete("1.0", "end")
+        self._activity_lines = 0
     
     def log_activity(self, message: str, level: str = 'info'):
-        """Log message to activity feed"""
+        """Queue message for the activity feed (flushed on the next tick)"""
         timestamp = time.strftime("%H:%M:%S")
+        self._activity_pending.append((f"[{timestamp}] {message}\n", level))
+    
+    def log_activities(self, activities: list):
+        """Queue a batch of bot activity entries, stamped with the time each was logged"""
+        # Bot entries carry a monotonic 'ts'; shift it onto the wall clock once per batch
+        offset = time.time() - time.monotonic()
+        pending = self._activity_pending
+        last_second = None
+        for activity in activities:
+            second = int(offset + activity['ts'])
+            if second != last_second:
+                last_second = second
+                timestamp = time.strftime("%H:%M:%S", time.localtime(second))
+            pending.append((f"[{timestamp}] {activity['message']}\n", activity.get('level', 'info')))
+    
+    def _flush_activity(self):
+        """Write queued messages in one insert and trim the feed back to ACTIVITY_MAX_LINES"""
+        # Messages wait in the (bounded) queue while the Dashboard tab is hidden
+        if not self._activity_pending or not self.activity_text.winfo_viewable():
+            return False
+        
+        lines = []
+        levels = []
+        while self._activity_pending:
+            line, level = self._activity_pending.popleft()
+            lines.append(line)
+            levels.append(level)
+        
+        first = int(self.activity_text.index("end-1c").split(".")[0])
+        self.activity_text.insert("end", "".join(lines))
+        self._activity_lines += len(lines)
+        
+        # Colour the new lines; plain info lines need no tag
+        for offset, level in enumerate(levels):
+            if level in ACTIVITY_LEVEL_COLORS:
+                row = first + offset
+                self.activity_text.tag_add(level, f"{row}.0", f"{row + 1}.0")
+        
+        if self._activity_lines > ACTIVITY_MAX_LINES + ACTIVITY_TRIM_SLACK:
+            excess = self._activity_lines - ACTIVITY_MAX_LINES
+            self.activity_text.delete("1.0", f"{excess + 1}.0")
+            self._activity_lines = ACTIVITY_MAX_LINES
         
-        self.activity_text.insert("end", f"[{timestamp}] {message}\n")
         self.activity_text.see("end")
+        return True
     
     # === GUI UPDATE LOOP ===
     
     def start_gui_updates(self):
-        """Start GUI update thread"""
-        self.running_updates = True
-        self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
-        self.update_thread.start()
-    
-    def _update_loop(self):
-        """Update GUI periodically"""
-        while self.running_updates:
+        """Start draining bot events on the Tk event loop"""
+        self._tick_id = self.after(TICK_MIN_MS, self._tick)
+        
+        # Pause refreshes while minimized/hidden
+        self.bind("<Map>", self._on_map, add="+")
+        self.bind("<Unmap>", self._on_unmap, add="+")
+    
+    def _tick(self):
+        """Drain pushed bot events and reschedule; idle ticks do no GUI work"""
+        try:
+            drained = self._drain_events()
+            flushed = self._flush_activity()
+        except TclError:
+            # Window is being destroyed; let the loop end
+            self._tick_id = None
+            return
+        
+        # Adapt to the event rate: react fast while busy, back off while idle
+        if drained or flushed:
+            self._tick_interval = TICK_MIN_MS
+        else:
+            self._tick_interval = min(self._tick_interval * 2, TICK_MAX_MS)
+        self._tick_id = self.after(self._tick_interval, self._tick)
+    
+    def _drain_events(self) -> int:
+        """Dispatch everything the bot pushed since the last tick; returns the event count"""
+        if not self.bot:
+            return 0
+        
+        count = 0
+        while True:
             try:
-                self.after(0, self.update_gui_elements)
-                time.sleep(1)
-            except:
-                pass
+                kind, payload = self.bot.event_queue.get_nowait()
+            except queue.Empty:
+                break
+            count += 1
+            handler = self._event_handlers.get(kind)
+            if handler:
+                handler(payload)
+        return count
+    
+    def _on_status(self, snapshot):
+        """Bot state changed"""
+        self._request_refresh()
+    
+    def _request_refresh(self):
+        """Schedule one coalesced refresh for the next idle moment"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.after_idle(self._do_refresh)
+    
+    def _do_refresh(self):
+        """Run the coalesced balance/positions/activity refresh"""
+        self._refresh_pending = False
+        try:
+            self.update_gui_elements()
+        except TclError:
+            pass
+        except Exception as e:
+            # Single guard for all updaters: surface the error instead of hiding it
+            logger.debug("GUI refresh failed: %s", e, exc_info=True)
+            self.log_activity(f"⚠️ GUI refresh error: {e}", 'warning')
+    
+    def _on_map(self, event):
+        """Window restored: refresh now and resume ticking"""
+        if event.widget is not self or self._tick_id is not None:
+            return
+        self._request_refresh()
+        self._tick_interval = TICK_MIN_MS
+        self._tick()
+    
+    def _on_unmap(self, event):
+        """Window minimized: stop the refresh loop"""
+        if event.widget is not self or self._tick_id is None:
+            return
+        self.after_cancel(self._tick_id)
+        self._tick_id = None
     
     def update_gui_elements(self):
         """Update GUI elements with latest data"""
-        if not self.bot:
+        if not self.bot or not self.winfo_viewable():
             return
         
-        try:
-            status = self.bot.get_status()
-            
-            # Update balance display
-            self.update_balance_display()
-            
-            # Update P&L
-            total_profit = status['total_profit']
-            color = 'green' if total_profit >= 0 else 'red'
-            self.profit_label.configure(
-                text=f"Total P&L: ${total_profit:.2f}",
-                text_color=color
-            )
-            
-            # Update trades
-            total = status['total_trades']
-            wins = status['winning_trades']
-            losses = status['losing_trades']
-            win_rate = (wins / total * 100) if total > 0 else 0
-            
-            self.trades_label.configure(text=f"Trades: {total} ({wins}W / {losses}L)")
-            self.winrate_label.configure(text=f"Win Rate: {win_rate:.1f}%")
-            
-            # Update positions
-            self.update_positions_display()
-            
-            # Update activity feed
-            self.update_activity_from_bot()
-            
-        except Exception as e:
-            pass
+        # Nothing changed since the last refresh
+        version = self.bot.state_version
+        if version == self._last_version:
+            return
+        self._last_version = version
+        
+        # Activity first: it drains the bot's queue, so a failing render below must not skip it
+        self.update_activity_from_bot()
+        
+        status = self.bot._status_snapshot
+        
+        # Update balance display
+        self.update_balance_display()
+        
+        # Update P&L
+        total_profit = status['total_profit']
+        color = 'green' if total_profit >= 0 else 'red'
+        self._set_label(
+            self.profit_label,
+            f"Total P&L: ${total_profit:.2f}",
+            foreground=color
+        )
+        
+        # Update trades
+        total = status['total_trades']
+        wins = status['winning_trades']
+        losses = status['losing_trades']
+        win_rate = status['win_rate']
+        
+        self._set_label(self.trades_label, f"Trades: {total} ({wins}W / {losses}L)")
+        self._set_label(self.winrate_label, f"Win Rate: {win_rate:.1f}%")
+        
+        # Update positions
+        self.update_positions_display()
     
     def update_balance_display(self):
         """Update balance display"""
         if not self.bot:
             return
         
-        mode = self.bot.mode
-        balance = self.bot.current_balance
+        status = self.bot._status_snapshot
+        mode = status['mode']
+        balance = status['current_balance']
         
-        self.balance_label.configure(
-            text=f"Balance: ${balance:.2f} ({mode.upper()})"
-        )
+        # Skip formatting entirely when neither balance nor mode moved
+        if (balance, mode) == self._last_balance:
+            return
+        self._last_balance = (balance, mode)
+        
+        self._set_label(self.balance_label, f"Balance: ${balance:.2f} ({mode.upper()})")
+    
+    def _set_label(self, label, text: str, **kwargs):
+        """Configure a label only if its text changed"""
+        if self._label_texts.get(label) == text:
+            return
+        self._label_texts[label] = text
+        label.configure(text=text, **kwargs)
     
     def update_activity_from_bot(self):
         """Pull activity from bot's queue"""
         if not self.bot:
             return
         
-        activities = self.bot.get_activity_log(limit=10)
-        for activity in activities:
-            msg = activity['message']
-            level = activity.get('level', 'info')
-            self.log_activity(msg, level)
+        self.log_activities(self.bot.get_activity_log())
     
     def update_positions_display(self):
-        """Update positions display"""
-        if not self.bot:
+        """Update positions display, touching only the rows that changed"""
+        # Positions tab not opened yet, or not the visible tab
+        if not self.bot or "Positions" in self._tab_builders:
+            return
+        if not self.open_positions_text.winfo_viewable():
             return
         
-        try:
-            # Open positions
-            self.open_positions_text.delete("1.0", "end")
-            if len(self.bot.open_positions) == 0:
-                self.open_positions_text.insert("1.0", "No open positions")
-            else:
-                for pos_id, pos in self.bot.open_positions.items():
-                    pnl = pos.get('pnl', 0)
-                    self.open_positions_text.insert("end",
-                        f"ID: {pos_id} | Token: {pos['token'][:10]}... | "
-                        f"Amount: {pos['amount']:.4f} | P&L: ${pnl:.2f} ({pos['pnl_percent']:.2f}%)\n"
-                    )
-            
-            # Closed positions
-            self.closed_positions_text.delete("1.0", "end")
-            recent_closed = self.bot.closed_positions[-10:]
-            if len(recent_closed) == 0:
-                self.closed_positions_text.insert("1.0", "No closed positions")
+        self._update_open_positions()
+        self._update_closed_positions()
+    
+    def _update_open_positions(self):
+        """Diff open positions against the rendered rows"""
+        box = self.open_positions_text
+        old = self._open_pos_cache
+        line_cache = {}
+        new = {}
+        # Snapshot first: the bot thread may open/close positions while we render
+        for pos_id, pos in list(self.bot.open_positions.items()):
+            pnl = pos.get('pnl', 0)
+            key = (pos['amount'], pnl, pos['pnl_percent'])
+            cached = self._line_cache.get(pos_id)
+            if cached and cached[0] == key:
+                line = cached[1]
             else:
-                for pos in recent_closed:
-                    self.closed_positions_text.insert("end",
-                        f"ID: {pos['id']} | Token: {pos['token'][:10]}... | "
-                        f"P&L: ${pos['pnl']:.2f} ({pos['pnl_percent']:.2f}%) | "
-                        f"Reason: {pos.get('close_reason', 'unknown')}\n"
-                    )
-        except Exception as e:
-            pass
+                line = _OPEN_POS_FMT % (pos_id, pos['token'][:10], pos['amount'], pnl, pos['pnl_percent'])
+            line_cache[pos_id] = (key, line)
+            new[pos_id] = line
+        
+        # Rebuilding the cache each pass evicts positions that closed
+        self._line_cache = line_cache
+        
+        if new == old:
+            return
+        
+        # Placeholder transitions: rewrite the whole box
+        if not new or not old:
+            self._rewrite_hidden(box, "".join(new.values()) or "No open positions", self._open_positions_label)
+            self._open_pos_cache = new
+            return
+        
+        # Most rows moved (prices ticked): one block insert beats 2 Tk calls per row
+        changed = sum(1 for pos_id, line in old.items() if new.get(pos_id) != line)
+        if changed * 2 > len(new):
+            box.delete("1.0", "end")
+            box.insert("1.0", "".join(new.values()))
+            self._open_pos_cache = new
+            return
+        
+        # Drop closed rows bottom-up so earlier line numbers stay valid
+        old_ids = list(old)
+        for row in range(len(old_ids) - 1, -1, -1):
+            if old_ids[row] not in new:
+                box.delete(f"{row + 1}.0", f"{row + 2}.0")
+        
+        # Rewrite rows whose numbers moved
+        kept = [pos_id for pos_id in old_ids if pos_id in new]
+        for row, pos_id in enumerate(kept):
+            if old[pos_id] != new[pos_id]:
+                box.delete(f"{row + 1}.0", f"{row + 2}.0")
+                box.insert(f"{row + 1}.0", new[pos_id])
+        
+        # Append newly opened positions in one insert
+        added = [pos_id for pos_id in new if pos_id not in old]
+        if added:
+            box.insert("end", "".join(new[pos_id] for pos_id in added))
+        
+        self._open_pos_cache = {pos_id: new[pos_id] for pos_id in kept + added}
+    
+    def _update_closed_positions(self):
+        """Append newly closed positions and trim the list to the last 10"""
+        box = self.closed_positions_list
+        # Bound every slice by this length so rows appended mid-render wait for the next pass
+        closed = self.bot.closed_positions
+        total = len(closed)
+        if total == self._closed_pos_seen:
+            return
+        
+        if self._closed_pos_seen is None or total < self._closed_pos_seen or not self._closed_pos_lines:
+            # First render, placeholder shown, or history was reset: refill the list
+            recent = closed[max(0, total - 10):total]
+            rows = [self._format_closed(pos) for pos in recent] or ["No closed positions"]
+            box.delete(0, "end")
+            box.insert("end", *rows)
+            self._closed_pos_lines = len(recent)
+        else:
+            new_rows = closed[max(self._closed_pos_seen, total - 10):total]
+            box.insert("end", *(self._format_closed(pos) for pos in new_rows))
+            self._closed_pos_lines += len(new_rows)
+            if self._closed_pos_lines > 10:
+                box.delete(0, self._closed_pos_lines - 10 - 1)
+                self._closed_pos_lines = 10
+        
+        self._closed_pos_seen = total
+    
+    def _rewrite_hidden(self, box, text: str, after):
+        """Replace a positions box's content while it is unmapped, so Tk lays it out once"""
+        box.pack_forget()
+        try:
+            box.delete("1.0", "end")
+            box.insert("1.0", text)
+        finally:
+            box.pack(padx=20, pady=10, after=after)
+    
+    def _format_closed(self, pos) -> str:
+        """Render one closed position row"""
+        return _CLOSED_POS_FMT % (
+            pos['id'], pos['token'][:10], pos['pnl'], pos['pnl_percent'], pos.get('close_reason', 'unknown')
+        )
 
 if __name__ == "__main__":
     app = TradingBotGUI()
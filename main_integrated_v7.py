@@ -7,6 +7,23 @@ import sys
 import os
 from pathlib import Path
 
+# Startup messages are buffered on interactive consoles and written in one call
+_startup_lines = []
+
+def startup_log(message: str):
+    """Buffer a startup message (streamed straight through when stdout is not a TTY)"""
+    if sys.stdout is not None and sys.stdout.isatty():
+        _startup_lines.append(message)
+    else:
+        print(message)
+
+def flush_startup_log():
+    """Write buffered startup messages with a single write"""
+    if _startup_lines and sys.stdout is not None:
+        sys.stdout.write("\n".join(_startup_lines) + "\n")
+        sys.stdout.flush()
+    _startup_lines.clear()
+
 def setup_python_path():
     """Setup Python path"""
     current_dir = Path(__file__).parent
@@ -18,43 +35,48 @@ def setup_python_path():
     if src_dir.exists() and str(src_dir) not in sys.path:
         sys.path.insert(0, str(src_dir))
     
-    print(f"✓ Python path configured")
+    startup_log(f"✓ Python path configured")
 
 setup_python_path()
 
 # Import modules
 try:
     from main_v7 import TradingBotV7
-    print("✓ Main bot module loaded")
+    startup_log("✓ Main bot module loaded")
 except ImportError as e:
+    flush_startup_log()
     print(f"❌ Error loading main_v7.py: {e}")
     input("\nPress Enter to exit...")
     sys.exit(1)
 
 try:
     from gui_v7 import TradingBotGUI
-    print("✓ GUI module loaded")
+    startup_log("✓ GUI module loaded")
 except ImportError as e:
+    flush_startup_log()
     print(f"❌ Error loading gui_v7.py: {e}")
     input("\nPress Enter to exit...")
     sys.exit(1)
 
 def main():
     """Main entry point"""
-    print("\n" + "="*60)
-    print("   DEX TRADING BOT V7.0 - PROFESSIONAL EDITION")
-    print("="*60)
-    print()
+    startup_log("\n" + "="*60)
+    startup_log("   DEX TRADING BOT V7.0 - PROFESSIONAL EDITION")
+    startup_log("="*60 + "\n")
     
     try:
-        print("🚀 Starting GUI...")
+        startup_log("🚀 Starting GUI...")
+        # Flush before building the GUI: the bot prints its RPC/module logs during construction
+        flush_startup_log()
         app = TradingBotGUI()
         app.mainloop()
         
     except KeyboardInterrupt:
+        flush_startup_log()
         print("\n\n⚠️ Bot stopped by user")
         
     except Exception as e:
+        flush_startup_log()
         print(f"\n\n❌ Fatal error: {e}")
         import traceback
         traceback.print_exc()
@@ -19,9 +19,28 @@ from web3 import Web3
 from typing import Dict, List, Optional
 import time
 import threading
+import asyncio
 from datetime import datetime
-import json
+import functools
 import queue
+from collections import deque
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import requests
+
+# orjson parses networks_v7.json much faster; stdlib json is the fallback
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    from json import loads as _loads
+
+# Websocket newHeads subscription (web3 v7+); the bot polls every 5s without it
+try:
+    from web3 import AsyncWeb3, WebSocketProvider
+    WS_AVAILABLE = True
+except ImportError:
+    WS_AVAILABLE = False
 
 # ✅ CRITICAL: Import price oracle
 try:
@@ -44,12 +63,99 @@ except ImportError:
     print("⚠️ opportunity_scanner_v7.py not found")
     OpportunityScanner = None
 
+NETWORKS_FILE = Path(__file__).parent / 'networks_v7.json'
+
+_WEI = 10**18
+
+def _to_wei(amount: float) -> int:
+    """Token amount -> wei (large amounts go through Decimal so float error isn't scaled by 1e18)"""
+    if abs(amount) < 1e9:
+        return int(round(amount * _WEI))
+    return int(Decimal(repr(amount)) * _WEI)
+
+@functools.lru_cache(maxsize=1)
+def _load_networks(mtime_ns: int) -> Dict:
+    """Parse networks_v7.json once per process (re-read only when its mtime changes)"""
+    return _loads(NETWORKS_FILE.read_bytes())
+
+@functools.lru_cache(maxsize=64)
+def _compute_grid_levels(current_price: float, grid_range_percent: float, grid_levels: int) -> tuple:
+    """Grid prices split into (buys below current_price, sells above it); cached per input"""
+    price_step = (current_price * grid_range_percent) / grid_levels
+    lower_bound = current_price * (1 - grid_range_percent / 2)
+    
+    levels = [lower_bound + (i * price_step) for i in range(grid_levels)]
+    buys = tuple(price for price in levels if price < current_price)
+    sells = tuple(price for price in levels if price > current_price)
+    return buys, sells
+
+class Position:
+    """One open/closed position with fixed slots instead of a per-position dict
+    
+    Keeps dict-style access (position['pnl'], position.get(...)) so the GUI, the
+    state manager and code that still hands positions over as dicts keep working.
+    """
+    
+    # Fixed attribute set - no per-instance __dict__
+    __slots__ = (
+        'id', 'token', 'amount', 'entry_price', 'current_price', 'pnl', 'pnl_percent',
+        'status', 'closed_at', 'close_reason', 'extra'
+    )
+    
+    def __init__(self, id: str = '', token: str = '', amount: float = 0.0, entry_price: float = 0.0,
+                 current_price: float = 0.0, pnl: float = 0.0, pnl_percent: float = 0.0,
+                 status: str = 'open', closed_at: str = None, close_reason: str = None, **extra):
+        self.id = id
+        self.token = token
+        self.amount = amount
+        self.entry_price = entry_price
+        self.current_price = current_price
+        self.pnl = pnl
+        self.pnl_percent = pnl_percent
+        self.status = status
+        self.closed_at = closed_at
+        self.close_reason = close_reason
+        self.extra = extra  # any other keys the position was created with
+    
+    def __getitem__(self, key: str):
+        if key in _POSITION_FIELDS:
+            return getattr(self, key)
+        return self.extra[key]
+    
+    def __setitem__(self, key: str, value):
+        if key in _POSITION_FIELDS:
+            setattr(self, key, value)
+        else:
+            self.extra[key] = value
+    
+    def __contains__(self, key: str) -> bool:
+        return key in _POSITION_FIELDS or key in self.extra
+    
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def to_dict(self) -> Dict:
+        """Plain dict (for JSON / state manager)"""
+        data = {field: getattr(self, field) for field in self.__slots__[:-1]}  # all but 'extra'
+        data.update(self.extra)
+        return data
+
+_POSITION_FIELDS = frozenset(Position.__slots__) - {'extra'}
+
 class TradingBotV7:
     """Main trading bot with FIXED pricing"""
     
+    _BASE_TOKENS = frozenset(('PLS', 'WPLS'))
+    _OPPORTUNITY_TYPES = frozenset(('arbitrage', 'momentum', 'whale_activity'))
+    _NATIVE_TOKENS = frozenset(('native', 'PLS', 'ETH', 'BNB'))
+    
     def __init__(self, network: str = 'pulsechain'):
         self.network = network
         self.web3 = None
+        self.rpc_session = None  # set by initialize_web3 (shared keep-alive session for the RPC node)
         self.backend = None
         
         # Bot state
@@ -71,26 +177,60 @@ class TradingBotV7:
         self.total_trades = 0
         self.winning_trades = 0
         self.losing_trades = 0
+        self.max_drawdown = 0.0
+        self._equity = 0.0
+        self._equity_peak = 0.0
+        
+        # Bumped on every state change so the GUI can skip idle refreshes
+        self.state_version = 0
         
-        # Strategy settings
-        self.enabled_strategies = []
+        # Strategy settings (frozenset, replaced on change: worker threads iterate it while the GUI toggles)
+        self.enabled_strategies = frozenset()
         self.strategy_settings = {}
         
+        # Immutable status dict republished on every state change (read lock-free by the GUI)
+        self._status_snapshot = self.get_status()
+        
         # Risk management
         self.max_position_size_percent = 0.05
         self.stop_loss_percent = 0.05
         self.take_profit_percent = 0.10
+        self._stop_ratio = -self.stop_loss_percent  # exit thresholds as PnL ratios
+        self._tp_ratio = self.take_profit_percent
         self.max_daily_loss_percent = 0.10
         self.min_trade_size_usd = 1.0
         self.slippage_tolerance = 0.005
         self.gas_price_multiplier = 1.2
+        self._refresh_risk_settings()
         
         # Threading
         self.bot_thread = None
+        self.ws_url = None  # set from the network's ws_rpcs
+        
+        # Independent opportunities run concurrently (they are RPC-bound)
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='opportunity')
+        self._stats_lock = threading.Lock()  # balance / profit / trade counters
+        self._swap_lock = threading.Lock()   # one on-chain swap at a time (nonces come from the node)
+        self._live_trade_lock = threading.Lock()  # live: size, balance check and swap as one step
+        
+        # Dispatch tables: opportunity type -> handler, trading mode -> swap function
+        self._handlers = {
+            'arbitrage': self._execute_arbitrage,
+            'momentum': self._execute_momentum_trade,
+            'whale_activity': self._execute_whale_follow
+        }
+        self._swap_handlers = {
+            'simulation': self._simulate_swap,
+            'paper': self._simulate_swap,
+            'live': self._execute_real_swap
+        }
         self.stop_event = threading.Event()
         
-        # Activity queue
-        self.activity_queue = queue.Queue()
+        # Activity buffer: deque append/popleft are atomic, maxlen bounds memory if nobody drains it
+        self.activity_queue = deque(maxlen=2000)
+        
+        # Push channel for UIs: (kind, payload) events, dropped if nobody drains it
+        self.event_queue = queue.Queue(maxsize=1000)
         
         # Scanner
         self.scanner = None
@@ -98,63 +238,92 @@ class TradingBotV7:
         # ✅ Price oracle
         self.price_oracle = price_oracle
         
+        # Token tables from networks_v7.json, loaded once in initialize_web3
+        self._common_tokens = {}
+        self._addr_to_symbol = {}
+        
+        # Per-cycle price memo: lowercase token -> (price, fetched_at)
+        self._price_cache = {}
+        self.price_ttl = 2.5  # shorter than the 5s loop sleep
+        
+        # Max balanceOf calls per JSON-RPC batch in get_tracked_tokens
+        self.erc20_batch_size = 100
+        
+        # Private Web3 for JSON-RPC batches: batch_requests() flags the whole provider,
+        # so batching on self.web3 would hand other threads' calls back unsent
+        self._batch_web3 = None
+        self._batch_lock = threading.Lock()
+        
         # Initialize
         self.initialize_web3()
     
     def log_activity(self, message: str, level: str = 'info'):
-        """Log activity"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        """Log activity ('ts' is time.monotonic(); consumers format it for display)"""
         activity = {
-            'timestamp': timestamp,
+            'ts': time.monotonic(),
             'message': message,
-            'level': level,
-            'time': time.time()
+            'level': level
         }
-        self.activity_queue.put(activity)
-        print(f"[{timestamp}] {message}")
+        self.activity_queue.append(activity)
+        self._mark_changed()
+        print(f"[{time.strftime('%H:%M:%S')}] {message}")
+    
+    def _mark_changed(self):
+        """Republish the status snapshot, bump state_version and notify listeners"""
+        self._status_snapshot = self.get_status()
+        self.state_version += 1
+        try:
+            self.event_queue.put_nowait(('status', self._status_snapshot))
+        except queue.Full:
+            pass
     
     def initialize_web3(self):
         """Initialize Web3"""
         try:
-            networks_file = Path(__file__).parent / 'networks_v7.json'
-            if networks_file.exists():
-                with open(networks_file, 'r') as f:
-                    networks = json.load(f)
-                    network_config = networks.get(self.network, {})
+            if NETWORKS_FILE.exists():
+                networks = _load_networks(NETWORKS_FILE.stat().st_mtime_ns)
+                network_config = networks.get(self.network, {})
+                self._load_token_tables(network_config)
+                
+                ws_rpcs = network_config.get('ws_rpcs', [])
+                self.ws_url = ws_rpcs[0] if ws_rpcs else None
+                
+                rpcs = network_config.get('rpcs', [])
+                if rpcs:
+                    rpc_url = rpcs[0]
+                    # Shared session keeps the TCP/TLS connection to the node alive between calls
+                    self.rpc_session = requests.Session()
+                    self.web3 = Web3(Web3.HTTPProvider(rpc_url, session=self.rpc_session))
+                    self._batch_web3 = Web3(Web3.HTTPProvider(rpc_url, session=self.rpc_session))
                     
-                    rpcs = network_config.get('rpcs', [])
-                    if rpcs:
-                        rpc_url = rpcs[0]
-                        self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+                    if self.web3.is_connected():
+                        self.log_activity(f"✅ Connected to {self.network}", 'success')
                         
-                        if self.web3.is_connected():
-                            self.log_activity(f"✅ Connected to {self.network}", 'success')
-                            
-                            if BackendModules:
-                                self.backend = BackendModules(self.web3, self.network)
-                                
-                                if self.backend.swap_executor:
-                                    self.log_activity("✅ Swap executor initialized", 'success')
-                                
-                                if self.backend.dex_router:
-                                    self.log_activity("✅ DEX router initialized", 'success')
-                                
-                                if self.backend.token_scanner:
-                                    self.log_activity("✅ Token scanner initialized", 'success')
+                        if BackendModules:
+                            self.backend = BackendModules(self.web3, self.network)
                             
-                            if OpportunityScanner:
-                                self.scanner = OpportunityScanner(self.web3, self.network)
-                                self.log_activity("✅ Opportunity scanner initialized", 'success')
+                            if self.backend.swap_executor:
+                                self.log_activity("✅ Swap executor initialized", 'success')
                             
-                            # ✅ Test price oracle
-                            if PRICE_ORACLE_AVAILABLE:
-                                test_price = self.price_oracle.get_price('WPLS')
-                                self.log_activity(f"✅ Price oracle active (WPLS: ${test_price:.8f})", 'success')
-                            else:
-                                self.log_activity("⚠️ Price oracle not available - using fallback", 'warning')
+                            if self.backend.dex_router:
+                                self.log_activity("✅ DEX router initialized", 'success')
                             
-                            return True
-            
+                            if self.backend.token_scanner:
+                                self.log_activity("✅ Token scanner initialized", 'success')
+                        
+                        if OpportunityScanner:
+                            self.scanner = OpportunityScanner(self.web3, self.network)
+                            self.log_activity("✅ Opportunity scanner initialized", 'success')
+                        
+                        # ✅ Test price oracle
+                        if PRICE_ORACLE_AVAILABLE:
+                            test_price = self.price_oracle.get_price('WPLS')
+                            self.log_activity(f"✅ Price oracle active (WPLS: ${test_price:.8f})", 'success')
+                        else:
+                            self.log_activity("⚠️ Price oracle not available - using fallback", 'warning')
+                        
+                        return True
+        
             self.log_activity(f"⚠️ Could not connect to {self.network}", 'warning')
             return False
             
@@ -162,6 +331,15 @@ class TradingBotV7:
             self.log_activity(f"❌ Web3 initialization error: {e}", 'error')
             return False
     
+    def _load_token_tables(self, network_config: Dict):
+        """Cache common tokens and a lowercase address -> symbol map for O(1) lookups"""
+        self._common_tokens = network_config.get('common_tokens', {})
+        addr_to_symbol = {}
+        for symbol, token_addr in self._common_tokens.items():
+            if isinstance(token_addr, str):
+                addr_to_symbol.setdefault(token_addr.lower(), symbol)
+        self._addr_to_symbol = addr_to_symbol
+    
     def update_risk_settings(self, settings: Dict):
         """Update risk settings"""
         if 'max_position_size_percent' in settings:
@@ -176,6 +354,9 @@ class TradingBotV7:
             self.take_profit_percent = settings['take_profit_percent']
             self.log_activity(f"Updated take profit: {settings['take_profit_percent']*100:.1f}%", 'info')
         
+        self._stop_ratio = -self.stop_loss_percent
+        self._tp_ratio = self.take_profit_percent
+        
         if 'max_daily_loss_percent' in settings:
             self.max_daily_loss_percent = settings['max_daily_loss_percent']
             self.log_activity(f"Updated max daily loss: {settings['max_daily_loss_percent']*100:.1f}%", 'info')
@@ -200,8 +381,17 @@ class TradingBotV7:
             self.min_trade_size_usd = settings['min_trade_size_usd']
             self.log_activity(f"Updated min trade size: ${settings['min_trade_size_usd']}", 'info')
         
+        self._refresh_risk_settings()
         return {'success': True}
     
+    def _refresh_risk_settings(self):
+        """Rebuild the scanner filter settings (shared by every opportunity in a cycle)"""
+        self._risk_settings_cache = {
+            'min_profit_usd': self.min_trade_size_usd,
+            'min_confidence': 'medium',
+            'enabled_opportunity_types': self._OPPORTUNITY_TYPES
+        }
+    
     def start_bot(self):
         """Start bot"""
         if self.running:
@@ -249,52 +439,105 @@ class TradingBotV7:
             return {'success': False, 'error': str(e)}
     
     def _bot_loop(self):
-        """Main bot loop"""
+        """Main bot loop: one cycle per new block, 5s polling if the node has no websocket"""
         self.log_activity("🤖 Bot loop started", 'info')
         
+        if WS_AVAILABLE and self.ws_url:
+            try:
+                asyncio.run(self._block_loop())
+            except Exception as e:
+                if self.running and not self.stop_event.is_set():
+                    self.log_activity(f"⚠️ newHeads subscription unavailable ({e}) - polling every 5s", 'warning')
+        
         while self.running and not self.stop_event.is_set():
             try:
                 if not self.paused:
                     self._execute_trading_cycle()
                 
-                time.sleep(5)
+                self.stop_event.wait(5)
                 
             except Exception as e:
                 self.log_activity(f"❌ Bot loop error: {e}", 'error')
-                time.sleep(10)
+                self.stop_event.wait(10)
         
         self.log_activity("🤖 Bot loop stopped", 'info')
     
+    async def _block_loop(self):
+        """Run a trading cycle whenever a new block lands (heads that arrive mid-cycle are coalesced)"""
+        new_head = asyncio.Event()
+        
+        # Single connect attempt: a node without WS should drop straight to polling
+        provider = WebSocketProvider(self.ws_url, max_connection_retries=1, request_timeout=10)
+        async with AsyncWeb3(provider) as w3:
+            await w3.eth.subscribe('newHeads')
+            self.log_activity("⚡ Subscribed to newHeads - trading on every block", 'success')
+            
+            async def read_heads():
+                async for _ in w3.socket.process_subscriptions():
+                    new_head.set()
+                raise ConnectionError("newHeads stream closed")
+            
+            async def watch_stop():
+                while self.running and not self.stop_event.is_set():
+                    await asyncio.sleep(0.5)
+            
+            reader = asyncio.create_task(read_heads())
+            stopper = asyncio.create_task(watch_stop())
+            for task in (reader, stopper):
+                task.add_done_callback(lambda _: new_head.set())
+            
+            try:
+                while True:
+                    await new_head.wait()
+                    new_head.clear()
+                    
+                    if stopper.done():
+                        break
+                    if reader.done():
+                        reader.result()  # re-raise so _bot_loop falls back to polling
+                    
+                    if not self.paused:
+                        try:
+                            await asyncio.to_thread(self._execute_trading_cycle)
+                        except Exception as e:
+                            self.log_activity(f"❌ Bot loop error: {e}", 'error')
+            finally:
+                reader.cancel()
+                stopper.cancel()
+    
     def _execute_trading_cycle(self):
         """Execute trading cycle"""
         try:
             self._update_positions_safe()
             
-            if self.scanner:
+            # Nothing enabled -> nothing could pass the filter below, skip the scan
+            if self.scanner and self.enabled_strategies:
                 opportunities = self.scanner.scan_for_opportunities()
                 
                 if opportunities:
+                    # Cheapest filter first: most opportunities never reach the scanner check
+                    enabled = self.enabled_strategies
+                    is_base_pair = self._is_pls_wpls_opportunity
+                    should_execute = self.scanner.should_execute_opportunity
+                    risk_settings = self._risk_settings_cache
+                    
+                    selected = []
                     for opp in opportunities:
-                        strategy_type = opp.get('type')
-                        if strategy_type not in self.enabled_strategies:
+                        if opp.get('type') not in enabled:
                             continue
-                        
-                        if not self._is_pls_wpls_opportunity(opp):
+                        if not is_base_pair(opp):
+                            continue
+                        if not should_execute(opp, risk_settings):
                             continue
                         
-                        risk_settings = {
-                            'min_profit_usd': self.min_trade_size_usd,
-                            'min_confidence': 'medium',
-                            'enabled_opportunity_types': ['arbitrage', 'momentum', 'whale_activity']
-                        }
-                        
-                        if self.scanner.should_execute_opportunity(opp, risk_settings):
-                            self.log_activity(f"✅ {self.scanner.format_opportunity(opp)}", 'opportunity')
-                            self._execute_opportunity(opp)
+                        self.log_activity(f"✅ {self.scanner.format_opportunity(opp)}", 'opportunity')
+                        selected.append(opp)
+                    
+                    self._execute_opportunities(selected)
                 
                 self.scanner.clear_old_opportunities()
             
-            if len(self.enabled_strategies) > 0:
+            if self.enabled_strategies:
                 self._check_strategies()
             
             if self.backend and self.backend.state_manager:
@@ -305,49 +548,57 @@ class TradingBotV7:
     
     def _is_pls_wpls_opportunity(self, opp: Dict) -> bool:
         """Check if opportunity uses PLS/WPLS as base"""
-        token_a = opp.get('token_a', '').upper()
-        token_b = opp.get('token_b', '').upper()
+        tokens = {opp.get('token_a', '').upper(), opp.get('token_b', '').upper()}
         
-        base_tokens = {'PLS', 'WPLS'}
+        # Arbitrage must trade a base pair; other strategies may name a single token
+        if opp['type'] != 'arbitrage':
+            tokens.add(opp.get('token', '').upper())
         
-        if opp['type'] == 'arbitrage':
-            if token_a not in base_tokens and token_b not in base_tokens:
-                return False
-        else:
-            token = opp.get('token', '').upper()
-            if token not in base_tokens and token_a not in base_tokens and token_b not in base_tokens:
-                return False
-        
-        return True
+        return not self._BASE_TOKENS.isdisjoint(tokens)
     
     def _update_positions_safe(self):
         """Update positions safely"""
         try:
-            position_ids = list(self.open_positions.keys())
+            # One snapshot of (id, position) pairs serves the price prefetch and the PnL pass
+            positions = tuple(self.open_positions.items())
+            if not positions:
+                return
+            self._prefetch_prices(position.get('token', '') for _, position in positions)
             
-            for position_id in position_ids:
-                if position_id not in self.open_positions:
-                    continue
-                
-                position = self.open_positions[position_id]
-                
-                # ✅ FIXED: Use real price
-                current_price = self._get_token_price(position['token'])
-                position['current_price'] = current_price
-                
-                entry_price = position['entry_price']
-                pnl_percent = ((current_price - entry_price) / entry_price) * 100
-                position['pnl_percent'] = pnl_percent
-                
-                position_value = position['amount'] * current_price
-                entry_value = position['amount'] * entry_price
-                pnl_usd = position_value - entry_value
-                position['pnl'] = pnl_usd
+            # Exits are collected and closed after the pass
+            stop_ratio = self._stop_ratio
+            tp_ratio = self._tp_ratio
+            to_close = []
+            
+            for position_id, position in positions:
+                # One bad position (zero entry price, failed price fetch) must not drop the other exits
+                try:
+                    # Positions handed over as dicts are converted once, on their first pass
+                    if position.__class__ is not Position:
+                        position = Position(**{'id': position_id, **position})
+                        self.open_positions[position_id] = position
+                    
+                    # ✅ FIXED: Use real price
+                    current_price = self._get_token_price(position.token)
+                    entry_price = position.entry_price
+                    pnl_ratio = (current_price - entry_price) / entry_price
+                    
+                    position.current_price = current_price
+                    position.pnl_percent = pnl_ratio * 100  # display value
+                    position.pnl = position.amount * (current_price - entry_price)
+                    
+                    if pnl_ratio <= stop_ratio:
+                        to_close.append((position_id, 'stop_loss'))
+                    elif pnl_ratio >= tp_ratio:
+                        to_close.append((position_id, 'take_profit'))
                 
-                if pnl_percent <= -self.stop_loss_percent * 100:
-                    self._close_position(position_id, reason='stop_loss')
-                elif pnl_percent >= self.take_profit_percent * 100:
-                    self._close_position(position_id, reason='take_profit')
+                except Exception as e:
+                    self.log_activity(f"❌ Position {position_id} update error: {e}", 'error')
+            
+            self._mark_changed()
+            
+            for position_id, reason in to_close:
+                self._close_position(position_id, reason=reason)
                 
         except Exception as e:
             self.log_activity(f"❌ Position update error: {e}", 'error')
@@ -355,10 +606,10 @@ class TradingBotV7:
     def execute_swap(self, token_in: str, token_out: str, amount_in: float) -> Dict:
         """Execute swap"""
         try:
-            if self.mode == 'simulation' or self.mode == 'paper':
-                return self._simulate_swap(token_in, token_out, amount_in)
-            elif self.mode == 'live':
-                return self._execute_real_swap(token_in, token_out, amount_in)
+            swap = self._swap_handlers.get(self.mode)
+            if swap:
+                return swap(token_in, token_out, amount_in)
+            return {'success': False, 'error': f'Unknown mode: {self.mode}'}
             
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -380,7 +631,7 @@ class TradingBotV7:
             if not self.backend or not self.backend.swap_executor:
                 return {'success': False, 'error': 'Swap executor not available'}
             
-            amount_in_wei = int(amount_in * 10**18)
+            amount_in_wei = _to_wei(amount_in)
             
             if self.backend.dex_router:
                 dex, amount_out = self.backend.dex_router.get_best_dex_for_swap(
@@ -393,13 +644,14 @@ class TradingBotV7:
             amount_out_min = int(amount_out * (1 - self.slippage_tolerance))
             
             if self.backend.wallet_manager and self.backend.wallet_manager.private_key:
-                result = self.backend.swap_executor.execute_swap(
-                    dex=dex,
-                    token_in=token_in,
-                    token_out=token_out,
-                    amount_in=amount_in_wei,
-                    min_amount_out=amount_out_min
-                )
+                with self._swap_lock:
+                    result = self.backend.swap_executor.execute_swap(
+                        dex=dex,
+                        token_in=token_in,
+                        token_out=token_out,
+                        amount_in=amount_in_wei,
+                        min_amount_out=amount_out_min
+                    )
                 
                 return result
             else:
@@ -408,18 +660,37 @@ class TradingBotV7:
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    def _execute_opportunities(self, opportunities: List[Dict]) -> List[Dict]:
+        """Execute independent opportunities in parallel on the worker pool (serially in live mode)"""
+        # Live trades all spend the same wallet balance, so they stay one at a time
+        if len(opportunities) <= 1 or self.mode == 'live':
+            return [self._execute_opportunity(opp) for opp in opportunities]
+        
+        futures = [self._executor.submit(self._execute_opportunity, opp) for opp in opportunities]
+        return [future.result() for future in as_completed(futures)]
+    
     def _execute_opportunity(self, opp: Dict):
         """✅ FIXED: Execute opportunity with proper USD→token conversion"""
+        # Live: the balance check only holds if no other trade spends in between
+        if self.mode == 'live':
+            with self._live_trade_lock:
+                return self._run_opportunity(opp)
+        return self._run_opportunity(opp)
+    
+    def _run_opportunity(self, opp: Dict):
+        """Size, check and execute one opportunity, then book the result"""
         try:
             self.log_activity(f"🎯 Executing opportunity: {opp['type']}", 'trade')
             
             # Calculate max trade size in USD
-            max_trade_size_usd = self.current_balance * self.max_position_size_percent
+            with self._stats_lock:
+                current_balance = self.current_balance
+            max_trade_size_usd = current_balance * self.max_position_size_percent
             
             if max_trade_size_usd < self.min_trade_size_usd:
                 max_trade_size_usd = self.min_trade_size_usd
             
-            self.log_activity(f"💰 Trade size: ${max_trade_size_usd:.2f} ({self.max_position_size_percent*100:.1f}% of ${self.current_balance:.2f})", 'info')
+            self.log_activity(f"💰 Trade size: ${max_trade_size_usd:.2f} ({self.max_position_size_percent*100:.1f}% of ${current_balance:.2f})", 'info')
             
             # LIVE MODE: Check balance
             if self.mode == 'live':
@@ -428,28 +699,25 @@ class TradingBotV7:
                     return {'success': False, 'error': 'Insufficient balance'}
             
             # Execute based on type
-            if opp['type'] == 'arbitrage':
-                result = self._execute_arbitrage(opp, max_trade_size_usd)
-            elif opp['type'] == 'momentum':
-                result = self._execute_momentum_trade(opp, max_trade_size_usd)
-            elif opp['type'] == 'whale_activity':
-                result = self._execute_whale_follow(opp, max_trade_size_usd)
+            handler = self._handlers.get(opp['type'])
+            if handler:
+                result = handler(opp, max_trade_size_usd)
             else:
                 result = {'success': False, 'error': 'Unknown opportunity type'}
             
             if result['success']:
                 profit = result.get('profit', 0)
                 
-                self.current_balance += profit
-                self.total_profit += profit
-                self.total_trades += 1
+                with self._stats_lock:
+                    self.current_balance += profit
+                    self.total_profit += profit
+                    self._record_trade(profit)
+                    current_balance = self.current_balance
                 
                 if profit > 0:
-                    self.winning_trades += 1
-                    self.log_activity(f"✅ Trade executed! Profit: ${profit:.2f} | Balance: ${self.current_balance:.2f}", 'success')
+                    self.log_activity(f"✅ Trade executed! Profit: ${profit:.2f} | Balance: ${current_balance:.2f}", 'success')
                 else:
-                    self.losing_trades += 1
-                    self.log_activity(f"⚠️ Trade executed. Loss: ${abs(profit):.2f} | Balance: ${self.current_balance:.2f}", 'warning')
+                    self.log_activity(f"⚠️ Trade executed. Loss: ${abs(profit):.2f} | Balance: ${current_balance:.2f}", 'warning')
             else:
                 self.log_activity(f"❌ Trade failed: {result.get('error')}", 'error')
             
@@ -557,7 +825,7 @@ class TradingBotV7:
                 amount_in_wei = self.price_oracle.calculate_token_amount_for_usd(sell_token, amount_usd)
             else:
                 # Fallback
-                amount_in_wei = int(amount_usd * 10**18)
+                amount_in_wei = _to_wei(amount_usd)
             
             sell_address = self._get_token_address(sell_token)
             buy_address = self._get_token_address(buy_token)
@@ -566,7 +834,7 @@ class TradingBotV7:
             self.log_activity(f"Step 1: Swapping {sell_token} → {buy_token} on {buy_dex}...", 'trade')
             
             # ✅ Execute with proper amount
-            amount_in_float = amount_in_wei / 10**18
+            amount_in_float = amount_in_wei / _WEI
             buy_result = self.execute_swap(
                 token_in=sell_address,
                 token_out=buy_address,
@@ -652,17 +920,12 @@ class TradingBotV7:
             
             current_price = 1.0
             
-            price_step = (current_price * grid_range_percent) / grid_levels
-            lower_bound = current_price * (1 - grid_range_percent / 2)
-            upper_bound = current_price * (1 + grid_range_percent / 2)
+            buys, sells = _compute_grid_levels(current_price, grid_range_percent, grid_levels)
             
-            for i in range(grid_levels):
-                grid_price = lower_bound + (i * price_step)
-                
-                if grid_price < current_price:
-                    self._place_grid_buy_order(grid_token_pair, grid_price)
-                elif grid_price > current_price:
-                    self._place_grid_sell_order(grid_token_pair, grid_price)
+            for grid_price in buys:
+                self._place_grid_buy_order(grid_token_pair, grid_price)
+            for grid_price in sells:
+                self._place_grid_sell_order(grid_token_pair, grid_price)
                     
         except Exception as e:
             self.log_activity(f"❌ Grid trading error: {e}", 'error')
@@ -680,55 +943,81 @@ class TradingBotV7:
     def _get_token_address(self, token_symbol: str) -> str:
         """Get token address"""
         try:
-            networks_file = Path(__file__).parent / 'networks_v7.json'
-            with open(networks_file, 'r') as f:
-                networks = json.load(f)
-                common_tokens = networks.get(self.network, {}).get('common_tokens', {})
-                
-                symbol_upper = token_symbol.upper()
-                address = common_tokens.get(symbol_upper)
-                
-                if address == 'native' or symbol_upper in ['PLS', 'ETH', 'BNB']:
-                    return 'native'
-                
-                return address if address else token_symbol
-                
+            symbol_upper = token_symbol.upper()
+            address = self._common_tokens.get(symbol_upper)
+            
+            if address == 'native' or symbol_upper in ['PLS', 'ETH', 'BNB']:
+                return 'native'
+            
+            return address if address else token_symbol
+            
         except Exception as e:
             return token_symbol
     
     def _get_token_price(self, token_address: str) -> float:
-        """✅ FIXED: Get real token price from oracle"""
+        """✅ FIXED: Get real token price from oracle (memoized for price_ttl seconds)"""
         try:
             if not PRICE_ORACLE_AVAILABLE:
                 return 1.0  # Fallback
             
+            key = token_address.lower()  # normalized once; the maps below are keyed lowercase
+            now = time.time()
+            cached = self._price_cache.get(key)
+            if cached and now - cached[1] < self.price_ttl:
+                return cached[0]
+            
             # Try to get symbol from address
-            token_symbol = self._get_token_symbol_from_address(token_address)
+            token_symbol = self._addr_to_symbol.get(key)
             
             if token_symbol:
                 price = self.price_oracle.get_price(token_symbol)
-                return price
+            else:
+                # Try by address directly
+                price = self.price_oracle.get_price_by_address(token_address)
+                price = price if price > 0 else 1.0
             
-            # Try by address directly
-            price = self.price_oracle.get_price_by_address(token_address)
-            return price if price > 0 else 1.0
+            self._price_cache[key] = (price, now)
+            return price
             
         except Exception as e:
             return 1.0
     
+    def _prefetch_prices(self, tokens):
+        """Fetch prices for many token addresses in one oracle batch call"""
+        if not PRICE_ORACLE_AVAILABLE:
+            return
+        
+        try:
+            now = time.time()
+            symbols = {}
+            for token in tokens:
+                key = str(token).lower()
+                if not key or key in symbols:
+                    continue
+                cached = self._price_cache.get(key)
+                if cached and now - cached[1] < self.price_ttl:
+                    continue
+                symbol = self._addr_to_symbol.get(key)
+                if symbol:
+                    symbols[key] = symbol
+            
+            if not symbols:
+                return
+            
+            prices = self.price_oracle.get_multiple_prices(list(set(symbols.values())))
+            now = time.time()
+            for key, symbol in symbols.items():
+                price = prices.get(symbol)
+                if price:
+                    self._price_cache[key] = (price, now)
+        except Exception as e:
+            # Per-token lookups still work without the batch
+            pass
+    
     def _get_token_symbol_from_address(self, address: str) -> Optional[str]:
         """Get symbol from address"""
         try:
-            networks_file = Path(__file__).parent / 'networks_v7.json'
-            with open(networks_file, 'r') as f:
-                networks = json.load(f)
-                common_tokens = networks.get(self.network, {}).get('common_tokens', {})
-                
-                for symbol, token_addr in common_tokens.items():
-                    if isinstance(token_addr, str) and token_addr.lower() == address.lower():
-                        return symbol
-                
-                return None
+            return self._addr_to_symbol.get(address.lower())
         except:
             return None
     
@@ -746,13 +1035,11 @@ class TradingBotV7:
             self.closed_positions.append(position)
             del self.open_positions[position_id]
             
-            if position['pnl'] > 0:
-                self.winning_trades += 1
-                self.total_profit += position['pnl']
-            else:
-                self.losing_trades += 1
-            
-            self.total_trades += 1
+            with self._stats_lock:
+                if position['pnl'] > 0:
+                    self.total_profit += position['pnl']
+                
+                self._record_trade(position['pnl'])
             
             if self.backend and self.backend.state_manager:
                 self.backend.state_manager.close_position(position_id)
@@ -762,6 +1049,21 @@ class TradingBotV7:
         except Exception as e:
             self.log_activity(f"❌ Position close error: {e}", 'error')
     
+    def _record_trade(self, pnl: float):
+        """Update running trade stats incrementally so status never scans trade history"""
+        self.total_trades += 1
+        if pnl > 0:
+            self.winning_trades += 1
+        else:
+            self.losing_trades += 1
+        
+        self._equity += pnl
+        if self._equity > self._equity_peak:
+            self._equity_peak = self._equity
+        drawdown = self._equity_peak - self._equity
+        if drawdown > self.max_drawdown:
+            self.max_drawdown = drawdown
+    
     def get_tracked_tokens(self) -> List[Dict]:
         """Get tracked tokens"""
         try:
@@ -788,11 +1090,17 @@ class TradingBotV7:
             if self.backend and hasattr(self.backend, 'token_scanner'):
                 token_scanner = self.backend.token_scanner
             
-            for token_symbol in list(position_tokens) + list(common_tokens.keys()):
-                if not token_symbol:
-                    continue
-                
-                token_address = self._get_token_address(token_symbol)
+            token_symbols = [symbol for symbol in list(position_tokens) + list(common_tokens.keys()) if symbol]
+            token_addresses = {symbol: self._get_token_address(symbol) for symbol in token_symbols}
+            
+            # Without a token scanner: every balance in one JSON-RPC batch, every price in one oracle call
+            balances = {}
+            if not token_scanner:
+                balances = self._get_balances_batch(list(token_addresses.values()))
+                self._prefetch_prices(token_addresses.values())
+            
+            for token_symbol in token_symbols:
+                token_address = token_addresses[token_symbol]
                 
                 balance = 0
                 balance_usd = 0
@@ -806,19 +1114,7 @@ class TradingBotV7:
                             price_usd = token_info.get('price_usd', 0)
                             balance_usd = balance * price_usd
                     else:
-                        if token_address not in ['native', 'PLS', 'ETH', 'BNB']:
-                            token_contract = self.web3.eth.contract(
-                                address=Web3.to_checksum_address(token_address),
-                                abi=self._get_erc20_abi()
-                            )
-                            balance_wei = token_contract.functions.balanceOf(
-                                self.backend.wallet_manager.address
-                            ).call()
-                            balance = balance_wei / 10**18
-                        else:
-                            balance = self.web3.eth.get_balance(
-                                self.backend.wallet_manager.address
-                            ) / 10**18
+                        balance = balances.get(token_address, 0)
                         
                         # ✅ Use real price
                         price_usd = self._get_token_price(token_address)
@@ -847,13 +1143,60 @@ class TradingBotV7:
     
     def _get_common_tokens(self) -> Dict:
         """Get common tokens"""
+        return self._common_tokens
+    
+    def _get_balances_batch(self, token_addresses: List[str]) -> Dict[str, float]:
+        """Wallet balances for many tokens, erc20_batch_size calls per JSON-RPC batch"""
+        balances = {}
+        wallet = self.backend.wallet_manager.address
+        if not wallet:
+            return balances
+        batch_web3 = self._batch_web3
+        wallet = Web3.to_checksum_address(wallet)
+        
+        # balanceOf(wallet) calldata is identical for every ERC20
+        calldata = '0x70a08231' + wallet[2:].lower().rjust(64, '0')
+        
+        unique = list(dict.fromkeys(token_addresses))
+        for start in range(0, len(unique), self.erc20_batch_size):
+            chunk = unique[start:start + self.erc20_batch_size]
+            try:
+                # Lock: the batching provider itself must not batch for two threads at once
+                with self._batch_lock, batch_web3.batch_requests() as batch:
+                    for token_address in chunk:
+                        if token_address in self._NATIVE_TOKENS:
+                            batch.add(batch_web3.eth.get_balance(wallet))
+                        else:
+                            batch.add(batch_web3.eth.call({
+                                'to': Web3.to_checksum_address(token_address),
+                                'data': calldata
+                            }))
+                    results = batch.execute()
+                
+                for token_address, result in zip(chunk, results):
+                    raw = result if isinstance(result, int) else int.from_bytes(result, 'big')
+                    balances[token_address] = raw / _WEI
+            
+            except Exception:
+                # Node without batch support, or one call failed: query this chunk one by one
+                for token_address in chunk:
+                    balances[token_address] = self._get_balance(token_address, wallet)
+        
+        return balances
+    
+    def _get_balance(self, token_address: str, wallet: str) -> float:
+        """Single balance lookup (0 on failure)"""
         try:
-            networks_file = Path(__file__).parent / 'networks_v7.json'
-            with open(networks_file, 'r') as f:
-                networks = json.load(f)
-                return networks.get(self.network, {}).get('common_tokens', {})
-        except:
-            return {}
+            if token_address in self._NATIVE_TOKENS:
+                return self.web3.eth.get_balance(wallet) / _WEI
+            
+            token_contract = self.web3.eth.contract(
+                address=Web3.to_checksum_address(token_address),
+                abi=self._get_erc20_abi()
+            )
+            return token_contract.functions.balanceOf(wallet).call() / _WEI
+        except Exception as e:
+            return 0
     
     def _get_erc20_abi(self) -> List:
         """Get ERC20 ABI"""
@@ -921,8 +1264,10 @@ class TradingBotV7:
             'total_trades': self.total_trades,
             'winning_trades': self.winning_trades,
             'losing_trades': self.losing_trades,
+            'win_rate': (self.winning_trades / self.total_trades * 100) if self.total_trades > 0 else 0,
+            'max_drawdown': self.max_drawdown,
             'total_profit': self.total_profit,
-            'enabled_strategies': self.enabled_strategies,
+            'enabled_strategies': sorted(self.enabled_strategies),
             'current_balance': self.current_balance,
             'trading_balance': self.trading_balance
         }
@@ -947,14 +1292,14 @@ class TradingBotV7:
     def enable_strategy(self, strategy: str):
         """Enable strategy"""
         if strategy not in self.enabled_strategies:
-            self.enabled_strategies.append(strategy)
+            self.enabled_strategies = self.enabled_strategies | {strategy}
             self.log_activity(f"Enabled strategy: {strategy}", 'info')
         return {'success': True}
     
     def disable_strategy(self, strategy: str):
         """Disable strategy"""
         if strategy in self.enabled_strategies:
-            self.enabled_strategies.remove(strategy)
+            self.enabled_strategies = self.enabled_strategies - {strategy}
             self.log_activity(f"Disabled strategy: {strategy}", 'info')
         return {'success': True}
     
@@ -977,9 +1322,10 @@ class TradingBotV7:
     def get_activity_log(self, limit: int = 100) -> List[Dict]:
         """Get activity log"""
         activities = []
-        while not self.activity_queue.empty() and len(activities) < limit:
-            try:
-                activities.append(self.activity_queue.get_nowait())
-            except:
-                break
+        popleft = self.activity_queue.popleft
+        try:
+            while len(activities) < limit:
+                activities.append(popleft())
+        except IndexError:
+            pass
         return activities
\ No newline at end of file